@@ -31,12 +31,13 @@ CREATE TABLE IF NOT EXISTS sentences (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     subcategory_id INTEGER NOT NULL,
     content TEXT,
+    sort_order INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (subcategory_id) REFERENCES subcategories(id) ON DELETE CASCADE
 );
 
 -- Indexes for better query performance
-CREATE INDEX IF NOT EXISTS idx_major_categories_project ON major_categories(project_id);
-CREATE INDEX IF NOT EXISTS idx_subcategories_major_category ON subcategories(major_category_id);
-CREATE INDEX IF NOT EXISTS idx_sentences_subcategory ON sentences(subcategory_id);
+CREATE INDEX IF NOT EXISTS idx_major_categories_project_order ON major_categories(project_id, sort_order);
+CREATE INDEX IF NOT EXISTS idx_subcategories_major_category_order ON subcategories(major_category_id, sort_order);
+CREATE INDEX IF NOT EXISTS idx_sentences_subcategory_order ON sentences(subcategory_id, sort_order);
@@ -4,6 +4,10 @@ Database Utilities - Centralized database operations
 """
 
 import sqlite3
+from contextlib import contextmanager
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
 from config import DB_PATH
 
 
@@ -15,6 +19,8 @@ class Database:
         self.db_path = db_path if db_path is not None else DB_PATH
         self.conn = None
         self.cursor = None
+        self.read_conn = None
+        self.read_cursor = None
         self.initialize()
     
     def initialize(self):
@@ -22,6 +28,10 @@ class Database:
         self.conn = sqlite3.connect(self.db_path)
         self.cursor = self.conn.cursor()
         
+        # WAL lets readers keep going while a write is in progress
+        self.cursor.execute("PRAGMA journal_mode=WAL")
+        self.cursor.execute("PRAGMA synchronous=NORMAL")
+        
         self.cursor.executescript("""
             CREATE TABLE IF NOT EXISTS projects (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -57,15 +67,24 @@ class Database:
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (subcategory_id) REFERENCES subcategories(id) ON DELETE CASCADE
             );
-
-            CREATE INDEX IF NOT EXISTS idx_major_categories_project ON major_categories(project_id);
-            CREATE INDEX IF NOT EXISTS idx_subcategories_major_category ON subcategories(major_category_id);
-            CREATE INDEX IF NOT EXISTS idx_sentences_subcategory ON sentences(subcategory_id);
         """)
         self.conn.commit()
         
         # Migration: Add sort_order column to sentences if it doesn't exist
         self._migrate_sort_order()
+        self._create_sort_indexes()
+        
+        self._open_read_connection()
+    
+    def _open_read_connection(self):
+        """Open a separate read-only connection for the listing queries"""
+        if self.db_path == ':memory:':
+            # An in-memory database cannot be shared between connections
+            self.read_conn = self.conn
+        else:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            self.read_conn = sqlite3.connect(uri, uri=True)
+        self.read_cursor = self.read_conn.cursor()
     
     def _migrate_sort_order(self):
         """Ensure sort_order column exists in sentences table"""
@@ -84,8 +103,45 @@ class Database:
             """)
             self.conn.commit()
     
+    def _create_sort_indexes(self):
+        """
+        Index each child table on (parent id, sort_order)
+        Ordered listings and MAX(sort_order) lookups become index seeks; these
+        replace the older single-column parent indexes, which they cover
+        """
+        self.cursor.executescript("""
+            DROP INDEX IF EXISTS idx_major_categories_project;
+            DROP INDEX IF EXISTS idx_subcategories_major_category;
+            DROP INDEX IF EXISTS idx_sentences_subcategory;
+
+            CREATE INDEX IF NOT EXISTS idx_major_categories_project_order ON major_categories(project_id, sort_order);
+            CREATE INDEX IF NOT EXISTS idx_subcategories_major_category_order ON subcategories(major_category_id, sort_order);
+            CREATE INDEX IF NOT EXISTS idx_sentences_subcategory_order ON sentences(subcategory_id, sort_order);
+        """)
+        self.conn.commit()
+    
+    @contextmanager
+    def _transaction(self):
+        """
+        Run a multi-statement change as a single write transaction
+        BEGIN IMMEDIATE takes the write lock before the first read, and the
+        block commits once on success or rolls back on an exception
+        """
+        # A transaction still open here means some earlier write was never committed
+        # or rolled back; report it rather than silently committing or discarding it
+        if self.conn.in_transaction:
+            raise sqlite3.OperationalError(
+                "uncommitted changes are pending on the connection; "
+                "commit or roll them back before starting a transaction"
+            )
+        self.conn.execute("BEGIN IMMEDIATE")
+        with self.conn:
+            yield
+    
     def close(self):
-        """Close database connection"""
+        """Close database connections"""
+        if self.read_conn and self.read_conn is not self.conn:
+            self.read_conn.close()
         if self.conn:
             self.conn.close()
     
@@ -97,12 +153,13 @@ class Database:
             self.conn.commit()
             return self.cursor.lastrowid
         except sqlite3.IntegrityError:
+            self.conn.rollback()
             return None
     
     def get_projects(self):
         """Get all projects ordered by update time"""
-        self.cursor.execute("SELECT id, name FROM projects ORDER BY updated_at DESC")
-        return self.cursor.fetchall()
+        self.read_cursor.execute("SELECT id, name FROM projects ORDER BY updated_at DESC")
+        return self.read_cursor.fetchall()
     
     def get_project(self, project_id):
         """Get a specific project"""
@@ -139,15 +196,16 @@ class Database:
             self.conn.commit()
             return self.cursor.lastrowid
         except sqlite3.IntegrityError:
+            self.conn.rollback()
             return None
     
     def get_major_categories(self, project_id):
         """Get all major categories for a project"""
-        self.cursor.execute(
+        self.read_cursor.execute(
             "SELECT id, name, sort_order FROM major_categories WHERE project_id = ? ORDER BY sort_order",
             (project_id,)
         )
-        return self.cursor.fetchall()
+        return self.read_cursor.fetchall()
     
     def update_major_category_name(self, major_category_id, new_name):
         """Update major category name"""
@@ -159,219 +217,198 @@ class Database:
             self.conn.commit()
             return True
         except sqlite3.IntegrityError:
+            self.conn.rollback()
             return False
     
     def move_major_category(self, major_category_id, target_project_id, target_sort_order):
         """Move a major category to a different project or position"""
-        # Get current info
-        self.cursor.execute(
-            "SELECT project_id, sort_order FROM major_categories WHERE id = ?",
-            (major_category_id,)
-        )
-        result = self.cursor.fetchone()
-        if not result:
-            return False
-        
-        source_project_id, source_sort_order = result
-        
-        # If moving to different project
-        if source_project_id != target_project_id:
-            # Get max sort_order in target project
+        with self._transaction():
+            # Get current info
             self.cursor.execute(
-                "SELECT COALESCE(MAX(sort_order), 0) FROM major_categories WHERE project_id = ?",
-                (target_project_id,)
+                "SELECT project_id, sort_order FROM major_categories WHERE id = ?",
+                (major_category_id,)
             )
-            target_sort_order = self.cursor.fetchone()[0] + 1
+            result = self.cursor.fetchone()
+            if not result:
+                return False
             
-            # Update the category
-            self.cursor.execute(
-                "UPDATE major_categories SET project_id = ?, sort_order = ? WHERE id = ?",
-                (target_project_id, target_sort_order, major_category_id)
-            )
+            source_project_id, source_sort_order = result
             
-            # Reorder source project
-            self.cursor.execute(
-                "UPDATE major_categories SET sort_order = sort_order - 1 WHERE project_id = ? AND sort_order > ?",
-                (source_project_id, source_sort_order)
-            )
-        else:
-            # Moving within same project
-            if target_sort_order != source_sort_order:
-                if target_sort_order < source_sort_order:
-                    # Moving up
-                    self.cursor.execute(
-                        "UPDATE major_categories SET sort_order = sort_order + 1 WHERE project_id = ? AND sort_order >= ? AND sort_order < ?",
-                        (source_project_id, target_sort_order, source_sort_order)
-                    )
-                else:
-                    # Moving down
-                    self.cursor.execute(
-                        "UPDATE major_categories SET sort_order = sort_order - 1 WHERE project_id = ? AND sort_order > ? AND sort_order <= ?",
-                        (source_project_id, source_sort_order, target_sort_order)
-                    )
+            # If moving to different project
+            if source_project_id != target_project_id:
+                # Get max sort_order in target project
+                self.cursor.execute(
+                    "SELECT COALESCE(MAX(sort_order), 0) FROM major_categories WHERE project_id = ?",
+                    (target_project_id,)
+                )
+                target_sort_order = self.cursor.fetchone()[0] + 1
                 
+                # Update the category
                 self.cursor.execute(
-                    "UPDATE major_categories SET sort_order = ? WHERE id = ?",
-                    (target_sort_order, major_category_id)
+                    "UPDATE major_categories SET project_id = ?, sort_order = ? WHERE id = ?",
+                    (target_project_id, target_sort_order, major_category_id)
                 )
+                
+                # Reorder source project
+                self.cursor.execute(
+                    "UPDATE major_categories SET sort_order = sort_order - 1 WHERE project_id = ? AND sort_order > ?",
+                    (source_project_id, source_sort_order)
+                )
+            else:
+                # Moving within same project
+                if target_sort_order != source_sort_order:
+                    if target_sort_order < source_sort_order:
+                        # Moving up
+                        self.cursor.execute(
+                            "UPDATE major_categories SET sort_order = sort_order + 1 WHERE project_id = ? AND sort_order >= ? AND sort_order < ?",
+                            (source_project_id, target_sort_order, source_sort_order)
+                        )
+                    else:
+                        # Moving down
+                        self.cursor.execute(
+                            "UPDATE major_categories SET sort_order = sort_order - 1 WHERE project_id = ? AND sort_order > ? AND sort_order <= ?",
+                            (source_project_id, source_sort_order, target_sort_order)
+                        )
+                    
+                    self.cursor.execute(
+                        "UPDATE major_categories SET sort_order = ? WHERE id = ?",
+                        (target_sort_order, major_category_id)
+                    )
         
-        self.conn.commit()
         return True
     
     def copy_major_category(self, major_category_id, target_project_id, target_sort_order):
         """Copy a major category (with all subcategories and sentences) to another project"""
-        # Get source category info
-        self.cursor.execute(
-            "SELECT name, project_id FROM major_categories WHERE id = ?",
-            (major_category_id,)
-        )
-        result = self.cursor.fetchone()
-        if not result:
-            return False
-        
-        mc_name, source_project_id = result
-        
-        # Get max sort_order in target project
-        self.cursor.execute(
-            "SELECT COALESCE(MAX(sort_order), 0) FROM major_categories WHERE project_id = ?",
-            (target_project_id,)
-        )
-        new_sort_order = self.cursor.fetchone()[0] + 1
-        
-        # Create new major category
-        self.cursor.execute(
-            "INSERT INTO major_categories (project_id, name, sort_order) VALUES (?, ?, ?)",
-            (target_project_id, mc_name, new_sort_order)
-        )
-        new_mc_id = self.cursor.lastrowid
-        
-        # Copy all subcategories
-        self.cursor.execute(
-            "SELECT id, name, sort_order FROM subcategories WHERE major_category_id = ? ORDER BY sort_order",
-            (major_category_id,)
-        )
-        subcategories = self.cursor.fetchall()
-        
-        for sc_id, sc_name, sc_order in subcategories:
-            # Create new subcategory
+        with self._transaction():
+            # Get source category info
             self.cursor.execute(
-                "INSERT INTO subcategories (major_category_id, name, sort_order) VALUES (?, ?, ?)",
-                (new_mc_id, sc_name, sc_order)
+                "SELECT name, project_id FROM major_categories WHERE id = ?",
+                (major_category_id,)
             )
-            new_sc_id = self.cursor.lastrowid
+            result = self.cursor.fetchone()
+            if not result:
+                return False
             
-            # Copy all sentences
+            mc_name, source_project_id = result
+            
+            # Get max sort_order in target project
             self.cursor.execute(
-                "SELECT content, sort_order FROM sentences WHERE subcategory_id = ? ORDER BY sort_order",
-                (sc_id,)
+                "SELECT COALESCE(MAX(sort_order), 0) FROM major_categories WHERE project_id = ?",
+                (target_project_id,)
             )
-            sentences = self.cursor.fetchall()
+            new_sort_order = self.cursor.fetchone()[0] + 1
             
-            for content, s_order in sentences:
-                self.cursor.execute(
-                    "INSERT INTO sentences (subcategory_id, content, sort_order) VALUES (?, ?, ?)",
-                    (new_sc_id, content, s_order)
-                )
+            # Create new major category
+            self.cursor.execute(
+                "INSERT INTO major_categories (project_id, name, sort_order) VALUES (?, ?, ?)",
+                (target_project_id, mc_name, new_sort_order)
+            )
+            new_mc_id = self.cursor.lastrowid
+            
+            # Copy all subcategories and sentences
+            self._copy_subcategories(major_category_id, new_mc_id)
         
-        self.conn.commit()
         return True
     
     def copy_major_category_before(self, major_category_id, before_mc_id):
         """Copy a major category before another heading in the same project"""
-        # Get source category info
-        self.cursor.execute(
-            "SELECT name, project_id FROM major_categories WHERE id = ?",
-            (major_category_id,)
-        )
-        result = self.cursor.fetchone()
-        if not result:
-            return False
-        
-        mc_name, source_project_id = result
-        
-        # Get target position
-        self.cursor.execute(
-            "SELECT sort_order, project_id FROM major_categories WHERE id = ?",
-            (before_mc_id,)
-        )
-        target_result = self.cursor.fetchone()
-        if not target_result:
-            return False
-        
-        target_sort_order, target_project_id = target_result
-        
-        # Must be in same project
-        if source_project_id != target_project_id:
-            return False
-        
-        # Shift existing categories down
-        self.cursor.execute(
-            "UPDATE major_categories SET sort_order = sort_order + 1 WHERE project_id = ? AND sort_order >= ?",
-            (target_project_id, target_sort_order)
-        )
-        
-        # Create new major category at target position
-        self.cursor.execute(
-            "INSERT INTO major_categories (project_id, name, sort_order) VALUES (?, ?, ?)",
-            (target_project_id, mc_name, target_sort_order)
-        )
-        new_mc_id = self.cursor.lastrowid
+        with self._transaction():
+            # Get source category info
+            self.cursor.execute(
+                "SELECT name, project_id FROM major_categories WHERE id = ?",
+                (major_category_id,)
+            )
+            result = self.cursor.fetchone()
+            if not result:
+                return False
+            
+            mc_name, source_project_id = result
+            
+            # Get target position
+            self.cursor.execute(
+                "SELECT sort_order, project_id FROM major_categories WHERE id = ?",
+                (before_mc_id,)
+            )
+            target_result = self.cursor.fetchone()
+            if not target_result:
+                return False
+            
+            target_sort_order, target_project_id = target_result
+            
+            # Must be in same project
+            if source_project_id != target_project_id:
+                return False
+            
+            # Shift existing categories down
+            self.cursor.execute(
+                "UPDATE major_categories SET sort_order = sort_order + 1 WHERE project_id = ? AND sort_order >= ?",
+                (target_project_id, target_sort_order)
+            )
+            
+            # Create new major category at target position
+            self.cursor.execute(
+                "INSERT INTO major_categories (project_id, name, sort_order) VALUES (?, ?, ?)",
+                (target_project_id, mc_name, target_sort_order)
+            )
+            new_mc_id = self.cursor.lastrowid
+            
+            # Copy all subcategories and sentences (same as copy_major_category)
+            self._copy_subcategories(major_category_id, new_mc_id)
         
-        # Copy all subcategories and sentences (same as copy_major_category)
+        return True
+    
+    def _copy_subcategories(self, source_mc_id, target_mc_id):
+        """
+        Copy every subcategory of source_mc_id, with its sentences, under target_mc_id
+        Each subcategory's sentences are copied by one INSERT ... SELECT
+        """
         self.cursor.execute(
             "SELECT id, name, sort_order FROM subcategories WHERE major_category_id = ? ORDER BY sort_order",
-            (major_category_id,)
+            (source_mc_id,)
         )
         subcategories = self.cursor.fetchall()
         
         for sc_id, sc_name, sc_order in subcategories:
+            # Create new subcategory
             self.cursor.execute(
                 "INSERT INTO subcategories (major_category_id, name, sort_order) VALUES (?, ?, ?)",
-                (new_mc_id, sc_name, sc_order)
+                (target_mc_id, sc_name, sc_order)
             )
             new_sc_id = self.cursor.lastrowid
             
+            # Copy all sentences
             self.cursor.execute(
-                "SELECT content, sort_order FROM sentences WHERE subcategory_id = ? ORDER BY sort_order",
-                (sc_id,)
+                """INSERT INTO sentences (subcategory_id, content, sort_order)
+                   SELECT ?, content, sort_order FROM sentences WHERE subcategory_id = ? ORDER BY sort_order""",
+                (new_sc_id, sc_id)
             )
-            sentences = self.cursor.fetchall()
-            
-            for content, s_order in sentences:
-                self.cursor.execute(
-                    "INSERT INTO sentences (subcategory_id, content, sort_order) VALUES (?, ?, ?)",
-                    (new_sc_id, content, s_order)
-                )
-        
-        self.conn.commit()
-        return True
     
     def delete_major_category(self, major_category_id):
         """Delete a major category and all its subcategories and sentences"""
-        # Get project_id and sort_order for reordering
-        self.cursor.execute(
-            "SELECT project_id, sort_order FROM major_categories WHERE id = ?",
-            (major_category_id,)
-        )
-        result = self.cursor.fetchone()
-        if not result:
-            return False
-        
-        project_id, sort_order = result
-        
-        # Delete the category (CASCADE will delete subcategories and sentences)
-        self.cursor.execute(
-            "DELETE FROM major_categories WHERE id = ?",
-            (major_category_id,)
-        )
-        
-        # Reorder remaining categories
-        self.cursor.execute(
-            "UPDATE major_categories SET sort_order = sort_order - 1 WHERE project_id = ? AND sort_order > ?",
-            (project_id, sort_order)
-        )
+        with self._transaction():
+            # Get project_id and sort_order for reordering
+            self.cursor.execute(
+                "SELECT project_id, sort_order FROM major_categories WHERE id = ?",
+                (major_category_id,)
+            )
+            result = self.cursor.fetchone()
+            if not result:
+                return False
+            
+            project_id, sort_order = result
+            
+            # Delete the category (CASCADE will delete subcategories and sentences)
+            self.cursor.execute(
+                "DELETE FROM major_categories WHERE id = ?",
+                (major_category_id,)
+            )
+            
+            # Reorder remaining categories
+            self.cursor.execute(
+                "UPDATE major_categories SET sort_order = sort_order - 1 WHERE project_id = ? AND sort_order > ?",
+                (project_id, sort_order)
+            )
         
-        self.conn.commit()
         return True
     
     # Subcategory (subheading) operations
@@ -410,6 +447,7 @@ class Database:
             self.conn.commit()
             return self.cursor.lastrowid
         except sqlite3.IntegrityError:
+            self.conn.rollback()
             return None
     
     def get_subcategories(self, major_category_id):
@@ -420,6 +458,24 @@ class Database:
         )
         return self.cursor.fetchall()
     
+    def get_project_subcategories(self, project_id):
+        """
+        Get the subcategories of every major category in a project with one query
+        Returns: {mc_id: [(id, name, sort_order), ...]}, each list as from get_subcategories
+        """
+        self.read_cursor.execute("""
+            SELECT sc.major_category_id, sc.id, sc.name, sc.sort_order
+            FROM subcategories sc
+            JOIN major_categories mc ON sc.major_category_id = mc.id
+            WHERE mc.project_id = ?
+            ORDER BY sc.major_category_id, sc.sort_order
+        """, (project_id,))
+        
+        return {
+            mc_id: [row[1:] for row in rows]
+            for mc_id, rows in groupby(self.read_cursor.fetchall(), key=itemgetter(0))
+        }
+    
     def update_subcategory_name(self, subcategory_id, new_name):
         """Update subcategory name"""
         try:
@@ -430,63 +486,64 @@ class Database:
             self.conn.commit()
             return True
         except sqlite3.IntegrityError:
+            self.conn.rollback()
             return False
     
     def move_subcategory(self, subcategory_id, target_major_category_id, target_sort_order):
         """Move a subcategory to a different major category or position"""
-        # Get current info
-        self.cursor.execute(
-            "SELECT major_category_id, sort_order FROM subcategories WHERE id = ?",
-            (subcategory_id,)
-        )
-        result = self.cursor.fetchone()
-        if not result:
-            return False
-        
-        source_major_category_id, source_sort_order = result
-        
-        # If moving to different major category
-        if source_major_category_id != target_major_category_id:
-            # Get max sort_order in target
+        with self._transaction():
+            # Get current info
             self.cursor.execute(
-                "SELECT COALESCE(MAX(sort_order), 0) FROM subcategories WHERE major_category_id = ?",
-                (target_major_category_id,)
+                "SELECT major_category_id, sort_order FROM subcategories WHERE id = ?",
+                (subcategory_id,)
             )
-            target_sort_order = self.cursor.fetchone()[0] + 1
+            result = self.cursor.fetchone()
+            if not result:
+                return False
             
-            # Update the subcategory
-            self.cursor.execute(
-                "UPDATE subcategories SET major_category_id = ?, sort_order = ? WHERE id = ?",
-                (target_major_category_id, target_sort_order, subcategory_id)
-            )
+            source_major_category_id, source_sort_order = result
             
-            # Reorder source major category
-            self.cursor.execute(
-                "UPDATE subcategories SET sort_order = sort_order - 1 WHERE major_category_id = ? AND sort_order > ?",
-                (source_major_category_id, source_sort_order)
-            )
-        else:
-            # Moving within same major category
-            if target_sort_order != source_sort_order:
-                if target_sort_order < source_sort_order:
-                    # Moving up
-                    self.cursor.execute(
-                        "UPDATE subcategories SET sort_order = sort_order + 1 WHERE major_category_id = ? AND sort_order >= ? AND sort_order < ?",
-                        (source_major_category_id, target_sort_order, source_sort_order)
-                    )
-                else:
-                    # Moving down
-                    self.cursor.execute(
-                        "UPDATE subcategories SET sort_order = sort_order - 1 WHERE major_category_id = ? AND sort_order > ? AND sort_order <= ?",
-                        (source_major_category_id, source_sort_order, target_sort_order)
-                    )
+            # If moving to different major category
+            if source_major_category_id != target_major_category_id:
+                # Get max sort_order in target
+                self.cursor.execute(
+                    "SELECT COALESCE(MAX(sort_order), 0) FROM subcategories WHERE major_category_id = ?",
+                    (target_major_category_id,)
+                )
+                target_sort_order = self.cursor.fetchone()[0] + 1
+                
+                # Update the subcategory
+                self.cursor.execute(
+                    "UPDATE subcategories SET major_category_id = ?, sort_order = ? WHERE id = ?",
+                    (target_major_category_id, target_sort_order, subcategory_id)
+                )
                 
+                # Reorder source major category
                 self.cursor.execute(
-                    "UPDATE subcategories SET sort_order = ? WHERE id = ?",
-                    (target_sort_order, subcategory_id)
+                    "UPDATE subcategories SET sort_order = sort_order - 1 WHERE major_category_id = ? AND sort_order > ?",
+                    (source_major_category_id, source_sort_order)
                 )
+            else:
+                # Moving within same major category
+                if target_sort_order != source_sort_order:
+                    if target_sort_order < source_sort_order:
+                        # Moving up
+                        self.cursor.execute(
+                            "UPDATE subcategories SET sort_order = sort_order + 1 WHERE major_category_id = ? AND sort_order >= ? AND sort_order < ?",
+                            (source_major_category_id, target_sort_order, source_sort_order)
+                        )
+                    else:
+                        # Moving down
+                        self.cursor.execute(
+                            "UPDATE subcategories SET sort_order = sort_order - 1 WHERE major_category_id = ? AND sort_order > ? AND sort_order <= ?",
+                            (source_major_category_id, source_sort_order, target_sort_order)
+                        )
+                    
+                    self.cursor.execute(
+                        "UPDATE subcategories SET sort_order = ? WHERE id = ?",
+                        (target_sort_order, subcategory_id)
+                    )
         
-        self.conn.commit()
         return True
     
     # Sentence operations
@@ -523,62 +580,62 @@ class Database:
     
     def delete_sentence(self, sentence_id):
         """Delete a sentence and reorder remaining sentences"""
-        # Get sentence info
-        self.cursor.execute(
-            "SELECT subcategory_id, sort_order FROM sentences WHERE id = ?",
-            (sentence_id,)
-        )
-        result = self.cursor.fetchone()
-        if not result:
-            return False
-        
-        subcategory_id, sort_order = result
-        
-        # Delete the sentence
-        self.cursor.execute("DELETE FROM sentences WHERE id = ?", (sentence_id,))
-        
-        # Reorder remaining sentences
-        self.cursor.execute(
-            "UPDATE sentences SET sort_order = sort_order - 1 WHERE subcategory_id = ? AND sort_order > ?",
-            (subcategory_id, sort_order)
-        )
+        with self._transaction():
+            # Get sentence info
+            self.cursor.execute(
+                "SELECT subcategory_id, sort_order FROM sentences WHERE id = ?",
+                (sentence_id,)
+            )
+            result = self.cursor.fetchone()
+            if not result:
+                return False
+            
+            subcategory_id, sort_order = result
+            
+            # Delete the sentence
+            self.cursor.execute("DELETE FROM sentences WHERE id = ?", (sentence_id,))
+            
+            # Reorder remaining sentences
+            self.cursor.execute(
+                "UPDATE sentences SET sort_order = sort_order - 1 WHERE subcategory_id = ? AND sort_order > ?",
+                (subcategory_id, sort_order)
+            )
         
-        self.conn.commit()
         return True
     
     def move_sentence(self, sentence_id, target_subcategory_id):
         """Move a sentence to a different subcategory"""
-        # Get source info
-        self.cursor.execute(
-            "SELECT subcategory_id, sort_order FROM sentences WHERE id = ?",
-            (sentence_id,)
-        )
-        result = self.cursor.fetchone()
-        if not result:
-            return False
-        
-        source_subcategory_id, source_sort_order = result
-        
-        # Get target sort_order
-        self.cursor.execute(
-            "SELECT COALESCE(MAX(sort_order), 0) + 1 FROM sentences WHERE subcategory_id = ?",
-            (target_subcategory_id,)
-        )
-        target_sort_order = self.cursor.fetchone()[0]
-        
-        # Move the sentence
-        self.cursor.execute(
-            "UPDATE sentences SET subcategory_id = ?, sort_order = ? WHERE id = ?",
-            (target_subcategory_id, target_sort_order, sentence_id)
-        )
-        
-        # Reorder source subcategory
-        self.cursor.execute(
-            "UPDATE sentences SET sort_order = sort_order - 1 WHERE subcategory_id = ? AND sort_order > ?",
-            (source_subcategory_id, source_sort_order)
-        )
+        with self._transaction():
+            # Get source info
+            self.cursor.execute(
+                "SELECT subcategory_id, sort_order FROM sentences WHERE id = ?",
+                (sentence_id,)
+            )
+            result = self.cursor.fetchone()
+            if not result:
+                return False
+            
+            source_subcategory_id, source_sort_order = result
+            
+            # Get target sort_order
+            self.cursor.execute(
+                "SELECT COALESCE(MAX(sort_order), 0) + 1 FROM sentences WHERE subcategory_id = ?",
+                (target_subcategory_id,)
+            )
+            target_sort_order = self.cursor.fetchone()[0]
+            
+            # Move the sentence
+            self.cursor.execute(
+                "UPDATE sentences SET subcategory_id = ?, sort_order = ? WHERE id = ?",
+                (target_subcategory_id, target_sort_order, sentence_id)
+            )
+            
+            # Reorder source subcategory
+            self.cursor.execute(
+                "UPDATE sentences SET sort_order = sort_order - 1 WHERE subcategory_id = ? AND sort_order > ?",
+                (source_subcategory_id, source_sort_order)
+            )
         
-        self.conn.commit()
         return True
     
     def copy_sentence(self, sentence_id, target_subcategory_id):
@@ -600,35 +657,35 @@ class Database:
     
     def insert_sentence(self, target_line_num, content, project_id):
         """Insert a sentence before a specific line number"""
-        # Get all lines to find the target
-        lines = self.get_all_lines(project_id)
-        
-        if target_line_num < 1 or target_line_num > len(lines):
-            return False
-        
-        # Get the sentence at target line
-        target_sentence = lines[target_line_num - 1]
-        subcategory_id = target_sentence[3]  # sc_id
-        target_sort_order = target_sentence[-1]  # Last item is sort_order
-        
-        # Shift sentences down
-        self.cursor.execute(
-            "UPDATE sentences SET sort_order = sort_order + 1 WHERE subcategory_id = ? AND sort_order >= ?",
-            (subcategory_id, target_sort_order)
-        )
-        
-        # Insert new sentence
-        self.cursor.execute(
-            "INSERT INTO sentences (subcategory_id, content, sort_order) VALUES (?, ?, ?)",
-            (subcategory_id, content, target_sort_order)
-        )
+        with self._transaction():
+            # Get all lines to find the target
+            lines = self.get_all_lines(project_id)
+            
+            if target_line_num < 1 or target_line_num > len(lines):
+                return False
+            
+            # Get the sentence at target line
+            target_sentence = lines[target_line_num - 1]
+            subcategory_id = target_sentence[3]  # sc_id
+            target_sort_order = target_sentence[-1]  # Last item is sort_order
+            
+            # Shift sentences down
+            self.cursor.execute(
+                "UPDATE sentences SET sort_order = sort_order + 1 WHERE subcategory_id = ? AND sort_order >= ?",
+                (subcategory_id, target_sort_order)
+            )
+            
+            # Insert new sentence
+            self.cursor.execute(
+                "INSERT INTO sentences (subcategory_id, content, sort_order) VALUES (?, ?, ?)",
+                (subcategory_id, content, target_sort_order)
+            )
         
-        self.conn.commit()
         return self.cursor.lastrowid
     
     def get_all_lines(self, project_id):
         """Get all lines (sentences) for a project with full context"""
-        self.cursor.execute("""
+        self.read_cursor.execute("""
             SELECT 
                 s.id,
                 mc.id as mc_id,
@@ -643,9 +700,65 @@ class Database:
             JOIN subcategories sc ON s.subcategory_id = sc.id
             JOIN major_categories mc ON sc.major_category_id = mc.id
             WHERE mc.project_id = ?
-            ORDER BY mc.sort_order, sc.sort_order, s.sort_order
+            ORDER BY mc.sort_order, mc.id, sc.sort_order, sc.id, s.sort_order
         """, (project_id,))
-        return self.cursor.fetchall()
+        return self.read_cursor.fetchall()
+    
+    def get_line_previews_for_projects(self, project_ids, preview_length):
+        """
+        Get all lines of several projects with content truncated for display, in a single query
+        Same columns as get_all_lines; content longer than preview_length is cut
+        and ends in "..." so long sentences never leave SQLite.
+        A heading without sentences yields one row whose sentence and
+        subcategory columns are NULL, so the rows describe the whole outline
+        Returns: {project_id: rows} (projects without headings are left out)
+        """
+        placeholders = ", ".join("?" * len(project_ids))
+        self.read_cursor.execute(f"""
+            SELECT
+                mc.project_id,
+                s.id,
+                mc.id as mc_id,
+                mc.name as major_category,
+                sc.id as sc_id,
+                sc.name as subcategory,
+                CASE WHEN LENGTH(s.content) > ? THEN SUBSTR(s.content, 1, ?) || '...'
+                     ELSE COALESCE(s.content, '') END as preview,
+                mc.sort_order,
+                sc.sort_order as sc_order,
+                s.sort_order
+            FROM major_categories mc
+            LEFT JOIN (subcategories sc
+                       JOIN sentences s ON s.subcategory_id = sc.id)
+                ON sc.major_category_id = mc.id
+            WHERE mc.project_id IN ({placeholders})
+            ORDER BY mc.project_id, mc.sort_order, mc.id, sc.sort_order, sc.id, s.sort_order
+        """, (preview_length, preview_length, *project_ids))
+        
+        return {
+            project_id: [row[1:] for row in rows]
+            for project_id, rows in groupby(self.read_cursor.fetchall(), key=itemgetter(0))
+        }
+    
+    def get_major_category_project_id(self, major_category_id):
+        """Get the id of the project a major category belongs to (None if not found)"""
+        self.read_cursor.execute(
+            "SELECT project_id FROM major_categories WHERE id = ?",
+            (major_category_id,)
+        )
+        result = self.read_cursor.fetchone()
+        return result[0] if result else None
+    
+    def get_subcategory_project_id(self, subcategory_id):
+        """Get the id of the project a subcategory belongs to (None if not found)"""
+        self.read_cursor.execute("""
+            SELECT mc.project_id
+            FROM subcategories sc
+            JOIN major_categories mc ON sc.major_category_id = mc.id
+            WHERE sc.id = ?
+        """, (subcategory_id,))
+        result = self.read_cursor.fetchone()
+        return result[0] if result else None
     
     def get_sentence_by_line_number(self, project_id, line_num):
         """Get a sentence by its line number in the project"""
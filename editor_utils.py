@@ -3,10 +3,16 @@
 Editor Utilities - Editor-specific helper functions with paging support
 """
 
+import re
 import string
+import sys
 from ui_utils import Colors, Screen
 
 
+# Heading command: 'h', heading letter, optional subheading number, optional text
+_HEADING_COMMAND_RE = re.compile(r'^h([a-zA-Z])(\d*)(.*)$', re.IGNORECASE)
+
+
 class EditorHelpers:
     """Helper functions for outline editor"""
     
@@ -37,8 +43,7 @@ class EditorHelpers:
         Parse a heading command like 'ha', 'ha Introduction', 'ha1', 'ha1 Background'
         Returns: (letter, number, text) or None if invalid
         """
-        import re
-        match = re.match(r'^h([a-zA-Z])(\d*)(.*)$', cmd, re.IGNORECASE)
+        match = _HEADING_COMMAND_RE.match(cmd)
         if not match:
             return None
         
@@ -64,15 +69,19 @@ class EditorHelpers:
         return heading_map
     
     @staticmethod
-    def build_subheading_map(db, project_id, heading_map):
+    def build_subheading_map(db, project_id, heading_map, project_subcategories=None):
         """
         Build a map of subheading keys to (sc_id, sc_name, mc_id)
+        project_subcategories: result of db.get_project_subcategories, fetched if not given
         Returns: {'a1': (5, 'Background', 1), 'a2': (6, 'Purpose', 1), ...}
         """
+        if project_subcategories is None:
+            project_subcategories = db.get_project_subcategories(project_id)
+        
         subheading_map = {}
         
         for heading_key, (mc_id, mc_name) in heading_map.items():
-            subcategories = db.get_subcategories(mc_id)
+            subcategories = project_subcategories.get(mc_id, [])
             for sub_idx, (sc_id, sc_name, sc_order) in enumerate(subcategories, 1):
                 subheading_key = EditorHelpers.get_subheading_key(heading_key, sub_idx)
                 subheading_map[subheading_key] = (sc_id, sc_name, mc_id)
@@ -89,11 +98,7 @@ class EditorHelpers:
         structure = {}
         
         for sentence_id, mc_id, major_cat, sc_id, subcat, content, mc_order, sc_order, s_order in lines:
-            if mc_id not in structure:
-                structure[mc_id] = {}
-            if sc_id not in structure[mc_id]:
-                structure[mc_id][sc_id] = []
-            structure[mc_id][sc_id].append((sentence_id, content))
+            structure.setdefault(mc_id, {}).setdefault(sc_id, []).append((sentence_id, content))
         
         return structure
     
@@ -118,15 +123,23 @@ class EditorHelpers:
             print(f"\n{Colors.DIM}(No headings yet - use 'ha <heading name>' to create first heading){Colors.RESET}\n")
             return {}, {}, 1
         
-        # Build maps
+        # Build maps (subheadings of all headings come from a single query)
+        project_subcategories = db.get_project_subcategories(project_id)
         heading_map = EditorHelpers.build_heading_map(db, project_id)
-        subheading_map = EditorHelpers.build_subheading_map(db, project_id, heading_map)
+        subheading_map = EditorHelpers.build_subheading_map(db, project_id, heading_map, project_subcategories)
         structure = EditorHelpers.build_outline_structure(db, project_id)
         
         # Build all output lines first
         all_lines = []
         line_num = 1
         
+        # Look the colors up once instead of on every line built below
+        reset, bright_blue, bright_white = Colors.RESET, Colors.BRIGHT_BLUE, Colors.BRIGHT_WHITE
+        cyan, bright_cyan, green = Colors.CYAN, Colors.BRIGHT_CYAN, Colors.GREEN
+        heading_style = Colors.BOLD_WHITE
+        collapsed_indicator = f"{Colors.DIM}[+]{reset}"
+        expanded_indicator = f"{Colors.DIM}[-]{reset}"
+        
         for idx, (mc_id, mc_name, mc_order) in enumerate(major_categories):
             letter = EditorHelpers.get_heading_key(idx)
             
@@ -134,8 +147,8 @@ class EditorHelpers:
             is_collapsed = letter in collapsed_headings
             
             # Print heading with collapse indicator
-            collapse_indicator = f"{Colors.DIM}[+]{Colors.RESET}" if is_collapsed else f"{Colors.DIM}[-]{Colors.RESET}"
-            heading_line = f"{collapse_indicator} {Colors.BRIGHT_BLUE}[{letter}]{Colors.RESET} {Colors.BOLD}{Colors.BRIGHT_WHITE}{mc_name}{Colors.RESET}"
+            collapse_indicator = collapsed_indicator if is_collapsed else expanded_indicator
+            heading_line = f"{collapse_indicator} {bright_blue}[{letter}]{reset} {heading_style}{mc_name}{reset}"
             all_lines.append(heading_line)
             
             # Skip content if collapsed
@@ -144,7 +157,7 @@ class EditorHelpers:
                 continue
             
             # Get subcategories for this heading
-            subcategories = db.get_subcategories(mc_id)
+            subcategories = project_subcategories.get(mc_id, [])
             
             # Print subheadings and their sentences
             for sub_idx, (sc_id, sc_name, sc_order) in enumerate(subcategories, 1):
@@ -152,13 +165,13 @@ class EditorHelpers:
                 
                 # If subcategory has a name, show it
                 if sc_name:
-                    subheading_line = f"  {Colors.CYAN}[{subheading_key}]{Colors.RESET} {Colors.BRIGHT_CYAN}{sc_name}{Colors.RESET}"
+                    subheading_line = f"  {cyan}[{subheading_key}]{reset} {bright_cyan}{sc_name}{reset}"
                     all_lines.append(subheading_line)
                 
                 # Print sentences under this subcategory
                 if mc_id in structure and sc_id in structure[mc_id]:
                     for sentence_id, content in structure[mc_id][sc_id]:
-                        sentence_line = f"    {Colors.GREEN}[{line_num}]{Colors.RESET} {Colors.BRIGHT_WHITE}{content}{Colors.RESET}"
+                        sentence_line = f"    {green}[{line_num}]{reset} {bright_white}{content}{reset}"
                         all_lines.append(sentence_line)
                         line_num += 1
             
@@ -176,10 +189,10 @@ class EditorHelpers:
         else:
             print()
         
-        # Print current page
+        # Print current page in a single write
         page_lines = all_lines[start_idx:end_idx]
-        for line in page_lines:
-            print(line)
+        if page_lines:
+            sys.stdout.write("\n".join(page_lines) + "\n")
         
         if line_num == 1:
             print(f"{Colors.DIM}(No content yet - use '+ <text>' to add sentences){Colors.RESET}\n")
@@ -5,6 +5,8 @@ Export Utilities - Export functionality for text and Word documents
 
 import os
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from docx import Document
 from docx.shared import Pt, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
@@ -54,20 +56,17 @@ class ExportManager:
             f.write(f"{project_name}\n")
             f.write("=" * len(project_name) + "\n\n")
             
-            for mc_id in sorted(content.keys(), key=lambda x: content[x]['order']):
-                mc = content[mc_id]
-                f.write(f"{mc['name']}\n")
-                f.write("-" * len(mc['name']) + "\n\n")
+            for mc_name, subcategories in content:
+                f.write(f"{mc_name}\n")
+                f.write("-" * len(mc_name) + "\n\n")
                 
-                for sc_id in sorted(mc['subcategories'].keys(), key=lambda x: mc['subcategories'][x]['order']):
-                    sc = mc['subcategories'][sc_id]
-                    
+                for sc_name, sentences in subcategories:
                     # Only print subheading if it has a name
-                    if sc['name']:
-                        f.write(f"  {sc['name']}\n\n")
+                    if sc_name:
+                        f.write(f"  {sc_name}\n\n")
                     
                     # Print sentences
-                    for sentence in sc['sentences']:
+                    for sentence in sentences:
                         f.write(f"    {sentence}\n\n")
                 
                 f.write("\n")
@@ -103,23 +102,19 @@ class ExportManager:
         paragraph_format.space_after = Pt(0)
         
         # Add content
-        for mc_id in sorted(content.keys(), key=lambda x: content[x]['order']):
-            mc = content[mc_id]
-            
+        for mc_name, subcategories in content:
             # Add major category (heading) - plain, left-justified
-            p = doc.add_paragraph(mc['name'])
+            p = doc.add_paragraph(mc_name)
             p.alignment = WD_ALIGN_PARAGRAPH.LEFT
             
-            for sc_id in sorted(mc['subcategories'].keys(), key=lambda x: mc['subcategories'][x]['order']):
-                sc = mc['subcategories'][sc_id]
-                
+            for sc_name, sentences in subcategories:
                 # Add subcategory (subheading) if it has a name - plain, left-justified
-                if sc['name']:
-                    p = doc.add_paragraph(sc['name'])
+                if sc_name:
+                    p = doc.add_paragraph(sc_name)
                     p.alignment = WD_ALIGN_PARAGRAPH.LEFT
                 
                 # Add sentences
-                for sentence in sc['sentences']:
+                for sentence in sentences:
                     p = doc.add_paragraph(sentence)
                     p.alignment = WD_ALIGN_PARAGRAPH.LEFT
         
@@ -136,7 +131,9 @@ class ExportManager:
     def _get_structured_content(self, db, project_id):
         """
         Get project content structured for export
-        Returns: {mc_id: {'name': str, 'order': int, 'subcategories': {...}}}
+        Rows come back from get_all_lines in sort order, so headings and
+        subheadings are consecutive runs that groupby walks in one pass
+        Returns: [(mc_name, [(sc_name, [sentence, ...]), ...]), ...]
         """
         # Get all lines
         lines = db.get_all_lines(project_id)
@@ -145,23 +142,12 @@ class ExportManager:
             return None
         
         # Organize content
-        content = {}
-        for sentence_id, mc_id, mc_name, sc_id, sc_name, s_content, mc_order, sc_order, s_order in lines:
-            if mc_id not in content:
-                content[mc_id] = {
-                    'name': mc_name,
-                    'order': mc_order,
-                    'subcategories': {}
-                }
-            
-            if sc_id not in content[mc_id]['subcategories']:
-                content[mc_id]['subcategories'][sc_id] = {
-                    'name': sc_name,
-                    'order': sc_order,
-                    'sentences': []
-                }
-            
-            if s_content:
-                content[mc_id]['subcategories'][sc_id]['sentences'].append(s_content)
+        content = []
+        for (mc_id, mc_name), mc_rows in groupby(lines, key=itemgetter(1, 2)):
+            subcategories = [
+                (sc_name, [row[5] for row in sc_rows if row[5]])
+                for (sc_id, sc_name), sc_rows in groupby(mc_rows, key=itemgetter(3, 4))
+            ]
+            content.append((mc_name, subcategories))
         
         return content
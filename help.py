@@ -4,24 +4,20 @@ Help System for Outline Management System
 Provides detailed help documentation for outline_editor and sentence_maintenance
 """
 
-from ui_utils import Colors, Screen, Input
+import re
+from ui_utils import Colors, Screen, Input, Pager
+
+
+# Arrow/function key sequences (ESC [ ... final, ESC O x) and lone ESC presses
+_ESCAPE_SEQUENCE = re.compile(r'\x1b(?:\[[0-9;]*[@-~]|O.)?')
 
 
 def chunk_content(lines, max_lines):
-    """Split content lines into chunks that fit on screen"""
-    chunks = []
-    current_chunk = []
-    
-    for line in lines:
-        current_chunk.append(line)
-        if len(current_chunk) >= max_lines:
-            chunks.append('\n'.join(current_chunk))
-            current_chunk = []
-    
-    if current_chunk:
-        chunks.append('\n'.join(current_chunk))
-    
-    return chunks
+    """
+    Split content lines into chunks that fit on screen
+    Returns: a Pager of line lists; only the page being shown is ever sliced
+    """
+    return Pager(lines, max(1, max_lines))
 
 
 def show_paged_help(content_lines, title):
@@ -37,38 +33,45 @@ def show_paged_help(content_lines, title):
     total_pages = len(pages)
     
     while True:
+        Screen.begin_frame()
         Screen.clear()
         
         # Header
-        print(f"{Colors.BLUE_BG}{' ' * cols}{Colors.RESET}")
-        print(f"{Colors.BLUE_BG}{Colors.BRIGHT_WHITE}{title:^{cols}}{Colors.RESET}")
-        print(f"{Colors.BLUE_BG}{' ' * cols}{Colors.RESET}")
-        print()
+        frame = [
+            f"{Colors.BLUE_BG}{' ' * cols}{Colors.RESET}",
+            f"{Colors.HELP_TITLE}{title:^{cols}}{Colors.RESET}",
+            f"{Colors.BLUE_BG}{' ' * cols}{Colors.RESET}",
+            "",
+        ]
         
         # Display current page
-        print(pages[current_page])
+        frame.append("\n".join(pages[current_page]))
         
         # Navigation bar
-        print()
-        print(f"{Colors.DIM}{'─' * cols}{Colors.RESET}")
+        frame.append("")
+        frame.append(f"{Colors.DIM}{'─' * cols}{Colors.RESET}")
         nav_text = f"Page {current_page + 1}/{total_pages}  |  "
         nav_text += f"{Colors.BRIGHT_YELLOW}h{Colors.RESET}:prev  "
         nav_text += f"{Colors.BRIGHT_YELLOW}l{Colors.RESET}:next  "
         nav_text += f"{Colors.BRIGHT_YELLOW}q{Colors.RESET}:quit"
-        print(nav_text)
-        print(f"{Colors.DIM}{'─' * cols}{Colors.RESET}")
+        frame.append(nav_text)
+        frame.append(f"{Colors.DIM}{'─' * cols}{Colors.RESET}")
         
-        # Get single keypress
-        ch = Input.getch()
+        # Send the whole page to the terminal in one write
+        Screen.write_frame("\n".join(frame) + "\n")
+        Screen.end_frame()
         
-        if ch == 'q' or ch == 'Q':
-            break
-        elif ch == 'h' or ch == 'H':
-            if current_page > 0:
-                current_page -= 1
-        elif ch == 'l' or ch == 'L':
-            if current_page < total_pages - 1:
-                current_page += 1
+        # Get keypresses - keys queued up while a page was drawn (a held h/l)
+        # are all applied before the next redraw; escape sequences are ignored
+        for ch in _ESCAPE_SEQUENCE.sub('', Input.read_keys()):
+            if ch == 'q' or ch == 'Q':
+                return
+            elif ch == 'h' or ch == 'H':
+                if current_page > 0:
+                    current_page -= 1
+            elif ch == 'l' or ch == 'L':
+                if current_page < total_pages - 1:
+                    current_page += 1
 
 
 def show_outline_editor_help():
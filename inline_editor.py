@@ -4,8 +4,7 @@ Inline editor with vim-style commands
 """
 
 import sys
-import tty
-import termios
+from ui_utils import Screen, Input
 
 class Colors:
     RESET = '\033[0m'
@@ -24,15 +23,8 @@ class Colors:
 
 
 def getch():
-    """Get a single character from stdin"""
-    fd = sys.stdin.fileno()
-    old_settings = termios.tcgetattr(fd)
-    try:
-        tty.setraw(sys.stdin.fileno())
-        ch = sys.stdin.read(1)
-    finally:
-        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    return ch
+    """Get a single character from stdin (the caller holds Input.raw_mode())"""
+    return sys.stdin.read(1)
 
 
 def edit_line_inline(line_num, current_text):
@@ -53,8 +45,7 @@ def edit_line_inline(line_num, current_text):
     def redraw():
         """Redraw the edit line - handles multi-line wrapping"""
         # Get terminal width
-        import os
-        term_width = os.get_terminal_size().columns
+        rows, term_width = Screen.get_size()
         
         # Calculate how many lines this text might occupy
         prefix_len = len(f"[{line_num}] ")
@@ -63,17 +54,8 @@ def edit_line_inline(line_num, current_text):
         if lines_needed > 5:
             lines_needed = 5  # Cap at 5 lines
         
-        # Move to beginning and clear multiple lines
-        sys.stdout.write('\r')
-        for i in range(lines_needed):
-            sys.stdout.write('\033[K')  # Clear line
-            if i < lines_needed - 1:
-                sys.stdout.write('\n')  # Move to next line
-        
-        # Move back up to start
-        if lines_needed > 1:
-            sys.stdout.write(f'\033[{lines_needed-1}A')  # Move up N-1 lines
-        sys.stdout.write('\r')  # Back to beginning
+        # Clear the lines the text may occupy and move back to the start
+        Screen.clear_lines(lines_needed)
         
         # Show line number
         sys.stdout.write(f"{Colors.GREEN}[{line_num}]{Colors.RESET} ")
@@ -98,96 +80,98 @@ def edit_line_inline(line_num, current_text):
     # Initial draw
     redraw()
     
-    while True:
-        ch = getch()
-        
-        if mode == 'normal':
-            if ch == 'i':
-                mode = 'insert'
-                redraw()
-            
-            elif ch == 'a':
-                mode = 'insert'
-                if cursor_pos < len(text):
-                    cursor_pos += 1
-                redraw()
-            
-            elif ch == 'A':
-                mode = 'insert'
-                cursor_pos = len(text)
-                redraw()
+    # Stay raw for the whole edit instead of switching modes around every key
+    with Input.raw_mode():
+        while True:
+            ch = getch()
             
-            elif ch == 'I':
-                mode = 'insert'
-                cursor_pos = 0
-                redraw()
-            
-            elif ch == 'x':
-                if cursor_pos < len(text):
-                    text = text[:cursor_pos] + text[cursor_pos+1:]
-                    if cursor_pos >= len(text) and cursor_pos > 0:
+            if mode == 'normal':
+                if ch == 'i':
+                    mode = 'insert'
+                    redraw()
+                
+                elif ch == 'a':
+                    mode = 'insert'
+                    if cursor_pos < len(text):
+                        cursor_pos += 1
+                    redraw()
+                
+                elif ch == 'A':
+                    mode = 'insert'
+                    cursor_pos = len(text)
+                    redraw()
+                
+                elif ch == 'I':
+                    mode = 'insert'
+                    cursor_pos = 0
+                    redraw()
+                
+                elif ch == 'x':
+                    if cursor_pos < len(text):
+                        text = text[:cursor_pos] + text[cursor_pos+1:]
+                        if cursor_pos >= len(text) and cursor_pos > 0:
+                            cursor_pos -= 1
+                    redraw()
+                
+                elif ch == 'd':
+                    if cursor_pos < len(text):
+                        next_space = text.find(' ', cursor_pos)
+                        if next_space == -1:
+                            text = text[:cursor_pos]
+                        else:
+                            text = text[:cursor_pos] + text[next_space+1:]
+                        if cursor_pos >= len(text) and cursor_pos > 0:
+                            cursor_pos = len(text)
+                    redraw()
+                
+                elif ch == 'h':
+                    if cursor_pos > 0:
                         cursor_pos -= 1
-                redraw()
-            
-            elif ch == 'd':
-                if cursor_pos < len(text):
-                    next_space = text.find(' ', cursor_pos)
-                    if next_space == -1:
-                        text = text[:cursor_pos]
-                    else:
-                        text = text[:cursor_pos] + text[next_space+1:]
-                    if cursor_pos >= len(text) and cursor_pos > 0:
-                        cursor_pos = len(text)
-                redraw()
+                    redraw()
+                
+                elif ch == 'l':
+                    if cursor_pos < len(text):
+                        cursor_pos += 1
+                    redraw()
+                
+                elif ch == '0':
+                    cursor_pos = 0
+                    redraw()
+                
+                elif ch == '$':
+                    cursor_pos = len(text)
+                    redraw()
+                
+                elif ch == '\x1b':
+                    print(f"\n{Colors.GREEN}✓{Colors.RESET} Saved\n")
+                    return text, False
+                
+                elif ch == 'q':
+                    print(f"\n{Colors.YELLOW}Cancelled{Colors.RESET}\n")
+                    return current_text, True
+                
+                elif ch == '\r' or ch == '\n':
+                    print(f"\n{Colors.GREEN}✓{Colors.RESET} Saved\n")
+                    return text, False
             
-            elif ch == 'h':
-                if cursor_pos > 0:
-                    cursor_pos -= 1
-                redraw()
-            
-            elif ch == 'l':
-                if cursor_pos < len(text):
+            elif mode == 'insert':
+                if ch == '\x1b':
+                    mode = 'normal'
+                    if cursor_pos > 0 and cursor_pos >= len(text):
+                        cursor_pos = len(text) - 1 if len(text) > 0 else 0
+                    redraw()
+                
+                elif ch == '\x7f' or ch == '\x08':
+                    if cursor_pos > 0:
+                        text = text[:cursor_pos-1] + text[cursor_pos:]
+                        cursor_pos -= 1
+                    redraw()
+                
+                elif ch == '\r' or ch == '\n':
+                    print(f"\n{Colors.GREEN}✓{Colors.RESET} Saved\n")
+                    return text, False
+                
+                elif ch >= ' ' and ch <= '~':
+                    text = text[:cursor_pos] + ch + text[cursor_pos:]
                     cursor_pos += 1
-                redraw()
-            
-            elif ch == '0':
-                cursor_pos = 0
-                redraw()
-            
-            elif ch == '$':
-                cursor_pos = len(text)
-                redraw()
-            
-            elif ch == '\x1b':
-                print(f"\n{Colors.GREEN}✓{Colors.RESET} Saved\n")
-                return text, False
-            
-            elif ch == 'q':
-                print(f"\n{Colors.YELLOW}Cancelled{Colors.RESET}\n")
-                return current_text, True
-            
-            elif ch == '\r' or ch == '\n':
-                print(f"\n{Colors.GREEN}✓{Colors.RESET} Saved\n")
-                return text, False
-        
-        elif mode == 'insert':
-            if ch == '\x1b':
-                mode = 'normal'
-                if cursor_pos > 0 and cursor_pos >= len(text):
-                    cursor_pos = len(text) - 1 if len(text) > 0 else 0
-                redraw()
-            
-            elif ch == '\x7f' or ch == '\x08':
-                if cursor_pos > 0:
-                    text = text[:cursor_pos-1] + text[cursor_pos:]
-                    cursor_pos -= 1
-                redraw()
-            
-            elif ch == '\r' or ch == '\n':
-                print(f"\n{Colors.GREEN}✓{Colors.RESET} Saved\n")
-                return text, False
-            
-            elif ch >= ' ' and ch <= '~':
-                text = text[:cursor_pos] + ch + text[cursor_pos:]
-                cursor_pos += 1
-                redraw()
+                    redraw()
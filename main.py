@@ -4,6 +4,7 @@ Project Outline System - Main Launcher
 """
 
 import os
+import shutil
 import sys
 import subprocess
 from project_state import get_active_project
@@ -34,16 +35,18 @@ class Colors:
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # Home the cursor and erase the display and scrollback without spawning `clear`
+        sys.stdout.write('\033[H\033[2J\033[3J')
+        sys.stdout.flush()
 
 
 def get_terminal_size():
     """Get terminal size (rows, columns)"""
-    try:
-        size = os.get_terminal_size()
-        return size.lines, size.columns
-    except:
-        return 24, 80
+    size = shutil.get_terminal_size(fallback=(80, 24))
+    return size.lines, size.columns
 
 
 def print_header():
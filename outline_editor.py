@@ -12,6 +12,10 @@ from inline_editor import edit_line_inline
 from help import show_outline_editor_help
 
 
+# Heading toggle command (@a, @b, ...), compiled once
+_TOGGLE_RE = re.compile(r'^@([a-zA-Z])$', re.IGNORECASE)
+
+
 def main():
     """Main outline editor function"""
     # Initialize database
@@ -91,6 +95,8 @@ def main():
     total_pages = 1
     
     while True:
+        # Everything up to the prompt is shown as one synchronized update
+        Screen.begin_frame()
         Screen.clear()
         
         # Get current project name
@@ -135,6 +141,7 @@ def main():
             ("q", "", "quit")
         ]
         UI.print_command_bar(commands)
+        Screen.end_frame()
         
         # Read command with F1 detection
         cmd, is_f1 = Input.read_command_with_f1()
@@ -167,7 +174,7 @@ def main():
         
         # Toggle collapse/expand
         elif command == '@':
-            match = re.match(r'^@([a-zA-Z])$', cmd, re.IGNORECASE)
+            match = _TOGGLE_RE.match(cmd)
             if not match:
                 UI.error("Invalid format. Use '@a' to toggle heading a")
                 continue
@@ -400,6 +407,8 @@ def run_outline_editor():
 
 if __name__ == "__main__":
     try:
+        # Let each frame go out in one piece when input() flushes it, not per line
+        Screen.buffer_output()
         main()
     except KeyboardInterrupt:
         print(f"\n\n{Colors.BRIGHT_CYAN}Exiting...{Colors.RESET}\n")
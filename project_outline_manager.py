@@ -5,6 +5,7 @@ Project Outline Manager - Menu-based interface for managing projects
 
 import sqlite3
 import os
+import sys
 from datetime import datetime
 from typing import List, Tuple, Optional
 from project_state import set_active_project
@@ -121,7 +122,12 @@ class ProjectOutlineManager:
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('clear' if os.name != 'nt' else 'cls')
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        # Home the cursor and erase the display and scrollback without spawning `clear`
+        sys.stdout.write('\033[H\033[2J\033[3J')
+        sys.stdout.flush()
 
 
 def main_menu():
@@ -4,100 +4,164 @@ Sentence Maintenance Module
 View, copy, and move sentences between projects with collapsible views and automatic paging
 """
 
-import re
 import string
-import time
-from ui_utils import Colors, Screen, Input, UI
+from collections import OrderedDict
+from itertools import groupby
+from operator import itemgetter
+from ui_utils import Colors, Screen, Input, UI, Pager
 from database_utils import Database
 from help import show_sentence_maintenance_help
 
 
-def build_all_output_lines(db, collapsed_projects):
+# Number of characters of each sentence shown in the listing
+PREVIEW_LENGTH = 50
+
+# Number of rendered listings (one per collapse state) kept by main()
+_OUTPUT_CACHE_SIZE = 8
+
+# Fixed fragments of the listing, formatted once instead of per project
+_IND_OPEN = f"{Colors.DIM}[-]{Colors.RESET}"
+_IND_CLOSED = f"{Colors.DIM}[+]{Colors.RESET}"
+_EMPTY_PROJECT_LINE = f"  {Colors.DIM}(Empty project){Colors.RESET}"
+_NO_SENTENCES_LINE = f"    {Colors.DIM}(no sentences){Colors.RESET}"
+_NO_PROJECTS_LINE = f"\n{Colors.DIM}(No projects found){Colors.RESET}\n"
+_TIP_LINE = f"{Colors.BRIGHT_CYAN}💡 Tip:{Colors.RESET} Use {Colors.BRIGHT_YELLOW}@<letter>{Colors.RESET} to expand a project (e.g., {Colors.BRIGHT_YELLOW}@a{Colors.RESET})"
+
+# Line templates with the color codes already in place; filled with str.format per row
+_PROJ_TPL = f" {Colors.BRIGHT_BLUE}[{{letter}}]{Colors.RESET} {Colors.BOLD_WHITE}{{name}}{Colors.RESET} {Colors.DIM}(proj_id:{Colors.RESET}{Colors.BRIGHT_YELLOW}{{proj_id}}{Colors.RESET}{Colors.DIM}){Colors.RESET}"
+_PROJ_OPEN_TPL = _IND_OPEN + _PROJ_TPL
+_PROJ_CLOSED_TPL = _IND_CLOSED + _PROJ_TPL
+_MC_TPL = f"  {Colors.CYAN}• {{name}}{Colors.RESET} {Colors.DIM}(mc_id:{Colors.RESET}{Colors.BRIGHT_YELLOW}{{mc_id}}{Colors.RESET}{Colors.DIM}){Colors.RESET}"
+_SC_TPL = f"    {Colors.BRIGHT_BLACK}→ {{name}}{Colors.RESET} {Colors.DIM}(sc_id:{Colors.RESET}{Colors.BRIGHT_YELLOW}{{sc_id}}{Colors.RESET}{Colors.DIM}){Colors.RESET}"
+_DIRECT_SC_TPL = f"    {Colors.BRIGHT_BLACK}→ {Colors.DIM}(direct){Colors.RESET} {Colors.DIM}(sc_id:{Colors.RESET}{Colors.BRIGHT_YELLOW}{{sc_id}}{Colors.RESET}{Colors.DIM}){Colors.RESET}"
+_S_TPL = f"      {Colors.GREEN}[{{s_id}}]{Colors.RESET} {Colors.BRIGHT_WHITE}{{preview}}{Colors.RESET}"
+_PAGE_TPL = f"{Colors.DIM}Page {{page}}/{{total}}{Colors.RESET}"
+
+# Characters allowed in a project toggle key ('a', 'b', ..., '#26')
+_TOGGLE_CHARS = frozenset(string.ascii_letters + string.digits + '#')
+
+COMMANDS = (
+    ("@x", "toggle"),
+    ("cs <s_id> <sc_id>", "copy sent"),
+    ("ch <mc_id> <before_mc_id>", "copy head"),
+    ("cp <mc_id> <proj_id>", "copy to proj"),
+    ("dh <mc_id>", "delete head"),
+    ("h/l", "page"),
+    ("?", "help"),
+    ("q", "quit")
+)
+
+
+def project_letter(idx):
+    """Get the toggle key for a project index: 'a'..'z', then '#26', '#27', etc."""
+    return string.ascii_lowercase[idx] if idx < 26 else f"#{idx}"
+
+
+def build_project_map(projects):
+    """Map each project's toggle key to its proj_id"""
+    return {project_letter(idx): proj_id for idx, (proj_id, _) in enumerate(projects)}
+
+
+def _parse_ids(cmd, count):
     """
-    Build all output lines for all projects (respecting collapse state)
-    Returns: (output_lines, project_map)
+    Parse the numeric arguments of a command like 'cs 12 34'
+    Returns: tuple of count ints, or None if the format is wrong
     """
-    projects = db.get_projects()
+    parts = cmd.split()
+    if len(parts) != count + 1 or not all(part.isdecimal() for part in parts[1:]):
+        return None
+    return tuple(int(part) for part in parts[1:])
+
+
+def build_project_lines(lines):
+    """
+    Build the heading, subheading and sentence lines shown under an expanded project
+    lines: the project's rows from db.get_line_previews_for_projects
+    """
+    if not lines:
+        return [_EMPTY_PROJECT_LINE]
+    
+    output_lines = []
     
+    # Rows arrive sorted by heading, subheading and sentence, so the
+    # whole tree is rebuilt by grouping consecutive rows in one pass
+    for (mc_id, mc_name), mc_rows in groupby(lines, key=itemgetter(1, 2)):
+        output_lines.append(_MC_TPL.format(name=mc_name, mc_id=mc_id))
+        
+        for (sc_id, sc_name), sc_rows in groupby(mc_rows, key=itemgetter(3, 4)):
+            if sc_id is None:
+                # Empty heading - show indicator
+                output_lines.append(_NO_SENTENCES_LINE)
+                continue
+            
+            if sc_name:
+                output_lines.append(_SC_TPL.format(name=sc_name, sc_id=sc_id))
+            else:
+                output_lines.append(_DIRECT_SC_TPL.format(sc_id=sc_id))
+            
+            for sentence_id, _, _, _, _, preview, _, _, _ in sc_rows:
+                output_lines.append(_S_TPL.format(s_id=sentence_id, preview=preview))
+    
+    return output_lines
+
+
+def build_all_output_lines(db, projects, collapsed_projects, project_lines_cache=None, project_map=None):
+    """
+    Build all output lines for all projects (respecting collapse state)
+    project_lines_cache: optional {proj_id: lines} dict reused between calls; the
+    caller must invalidate_project_lines() for every project it changes
+    project_map: optional result of build_project_map(projects), built if not given
+    Returns: output_lines
+    """
     if not projects:
-        return [f"\n{Colors.DIM}(No projects found){Colors.RESET}\n"], {}
+        return [_NO_PROJECTS_LINE]
+    
+    if project_lines_cache is None:
+        project_lines_cache = {}
+    
+    # Fetch the sentences of every expanded project not rendered yet in one query;
+    # when every project is collapsed (or already cached) the database isn't touched
+    to_render = [proj_id for proj_id, _ in projects
+                 if proj_id not in collapsed_projects and proj_id not in project_lines_cache]
+    if to_render:
+        project_rows = db.get_line_previews_for_projects(to_render, PREVIEW_LENGTH)
+        for proj_id in to_render:
+            project_lines_cache[proj_id] = build_project_lines(project_rows.get(proj_id, []))
+    
+    # Toggle keys are assigned once per project list, in the same order as projects
+    if project_map is None:
+        project_map = build_project_map(projects)
     
     output_lines = []
-    project_map = {}
     
-    for idx, (proj_id, proj_name) in enumerate(projects):
-        letter = string.ascii_lowercase[idx] if idx < 26 else f"#{idx}"
-        project_map[letter] = proj_id
-        
+    for letter, (proj_id, proj_name) in zip(project_map, projects):
         is_collapsed = proj_id in collapsed_projects
-        collapse_indicator = f"{Colors.DIM}[+]{Colors.RESET}" if is_collapsed else f"{Colors.DIM}[-]{Colors.RESET}"
+        project_tpl = _PROJ_CLOSED_TPL if is_collapsed else _PROJ_OPEN_TPL
         
-        output_lines.append(f"{collapse_indicator} {Colors.BRIGHT_BLUE}[{letter}]{Colors.RESET} {Colors.BOLD}{Colors.BRIGHT_WHITE}{proj_name}{Colors.RESET} {Colors.DIM}(proj_id:{Colors.RESET}{Colors.BRIGHT_YELLOW}{proj_id}{Colors.RESET}{Colors.DIM}){Colors.RESET}")
+        output_lines.append(project_tpl.format(letter=letter, name=proj_name, proj_id=proj_id))
         
         if not is_collapsed:
-            # Show project structure - get ALL headings first
-            major_categories = db.get_major_categories(proj_id)
-            
-            if not major_categories:
-                output_lines.append(f"  {Colors.DIM}(Empty project){Colors.RESET}")
-            else:
-                # Build structure starting with ALL major categories
-                structure = {}
-                for mc_id, mc_name, mc_order in major_categories:
-                    structure[mc_id] = {
-                        'name': mc_name,
-                        'order': mc_order,
-                        'subcategories': {}
-                    }
-                
-                # Now add sentences to the structure
-                lines = db.get_all_lines(proj_id)
-                for sentence_id, mc_id, mc_name, sc_id, sc_name, content, mc_order, sc_order, s_order in lines:
-                    if mc_id in structure:  # Should always be true
-                        if sc_id not in structure[mc_id]['subcategories']:
-                            structure[mc_id]['subcategories'][sc_id] = {
-                                'name': sc_name,
-                                'order': sc_order,
-                                'sentences': []
-                            }
-                        
-                        structure[mc_id]['subcategories'][sc_id]['sentences'].append({
-                            'id': sentence_id,
-                            'content': content
-                        })
-                
-                # Display ALL headings (even empty ones) and sentences
-                for mc_id in sorted(structure.keys(), key=lambda x: structure[x]['order']):
-                    mc_data = structure[mc_id]
-                    output_lines.append(f"  {Colors.CYAN}• {mc_data['name']}{Colors.RESET} {Colors.DIM}(mc_id:{Colors.RESET}{Colors.BRIGHT_YELLOW}{mc_id}{Colors.RESET}{Colors.DIM}){Colors.RESET}")
-                    
-                    if not mc_data['subcategories']:
-                        # Empty heading - show indicator
-                        output_lines.append(f"    {Colors.DIM}(no sentences){Colors.RESET}")
-                    else:
-                        for sc_id in sorted(mc_data['subcategories'].keys(), key=lambda x: mc_data['subcategories'][x]['order']):
-                            sc_data = mc_data['subcategories'][sc_id]
-                            
-                            if sc_data['name']:
-                                output_lines.append(f"    {Colors.BRIGHT_BLACK}→ {sc_data['name']}{Colors.RESET} {Colors.DIM}(sc_id:{Colors.RESET}{Colors.BRIGHT_YELLOW}{sc_id}{Colors.RESET}{Colors.DIM}){Colors.RESET}")
-                            else:
-                                output_lines.append(f"    {Colors.BRIGHT_BLACK}→ {Colors.DIM}(direct){Colors.RESET} {Colors.DIM}(sc_id:{Colors.RESET}{Colors.BRIGHT_YELLOW}{sc_id}{Colors.RESET}{Colors.DIM}){Colors.RESET}")
-                            
-                            for sentence in sc_data['sentences']:
-                                content_preview = sentence['content'][:50] + "..." if len(sentence['content']) > 50 else sentence['content']
-                                output_lines.append(f"      {Colors.GREEN}[{sentence['id']}]{Colors.RESET} {Colors.BRIGHT_WHITE}{content_preview}{Colors.RESET}")
+            output_lines.extend(project_lines_cache[proj_id])
         
         output_lines.append("")  # Blank line between projects
     
-    return output_lines, project_map
+    return output_lines
+
+
+def invalidate_project_lines(project_lines_cache, proj_id):
+    """
+    Drop one project's rendered lines after it changed
+    proj_id: None when the changed project is unknown, which drops every project
+    """
+    if proj_id is None:
+        project_lines_cache.clear()
+    else:
+        project_lines_cache.pop(proj_id, None)
 
 
 def chunk_lines(lines, max_lines):
-    """Split lines into chunks that fit on screen"""
-    chunks = []
-    for i in range(0, len(lines), max_lines):
-        chunks.append(lines[i:i + max_lines])
-    return chunks if chunks else [[]]
+    """Split lines into chunks that fit on screen (only the page being shown is copied)"""
+    return Pager(lines, max_lines)
 
 
 def main():
@@ -106,56 +170,97 @@ def main():
     
     # Start with all projects collapsed
     projects = db.get_projects()
-    collapsed_projects = set(proj_id for proj_id, _ in projects)
+    project_map = build_project_map(projects)
+    project_ids = {proj_id for proj_id, _ in projects}
+    collapsed_projects = set(project_ids)
+    
+    # Result of the last command, shown above the command bar in the next frame;
+    # status_shown keeps the following command redrawing so the old one is cleared
+    status = None
+    status_shown = False
+    
+    # Rendered lines of expanded projects, invalidated per project as commands change them
+    project_lines_cache = {}
+    
+    # Whole listings keyed by (collapsed projects, db_version), least recently used first;
+    # db_version is bumped by every change so older listings are never reused
+    output_cache = OrderedDict()
+    db_version = 0
     
     while True:
-        # Build all output lines
-        output_lines, project_map = build_all_output_lines(db, collapsed_projects)
+        # The project list only changes on refresh, so keep it between redraws
+        if projects is None:
+            projects = db.get_projects()
+            project_map = build_project_map(projects)
+            project_ids = {proj_id for proj_id, _ in projects}
+            # Forget projects that no longer exist
+            collapsed_projects &= project_ids
+        
+        # Build all output lines, unless this collapse state was shown since the last change
+        cache_key = (frozenset(collapsed_projects), db_version)
+        output_lines = output_cache.get(cache_key)
+        if output_lines is None:
+            output_lines = build_all_output_lines(db, projects, collapsed_projects, project_lines_cache, project_map)
+            output_cache[cache_key] = output_lines
+            if len(output_cache) > _OUTPUT_CACHE_SIZE:
+                output_cache.popitem(last=False)
+        else:
+            output_cache.move_to_end(cache_key)
+        
+        # The command bar text is cached by UI per terminal width
+        command_bar = UI.format_command_bar(COMMANDS)
         
         # Calculate available lines for content
         rows, cols = Screen.get_size()
-        # Reserve: header(3) + tip(2) + command_bar(2) + prompt(1) + alert(1) = 9 lines
-        available_lines = max(5, rows - 9)
+        # Reserve: header(3) + tip(2) + status(2) + command_bar(2) + prompt(1) = 10 lines,
+        # plus any extra lines the command bar is wrapped onto
+        available_lines = max(5, rows - 10 - (command_bar.count("\n") - 4))
         
         # Chunk the output
         pages = chunk_lines(output_lines, available_lines)
         current_page = 0
         total_pages = len(pages)
         
-        # Paging loop
+        # Paging loop - the screen is only redrawn when something visible changed
+        dirty = True
         while True:
-            Screen.clear()
-            UI.print_header("SENTENCE MAINTENANCE")
-            
-            # Display current page
-            print()
-            for line in pages[current_page]:
-                print(line)
-            
-            # Show helpful prompt if all projects are collapsed
-            all_projects = db.get_projects()
-            all_collapsed = all(proj_id in collapsed_projects for proj_id, _ in all_projects)
-            
-            if all_collapsed and all_projects:
-                print(f"\n{Colors.BRIGHT_CYAN}💡 Tip:{Colors.RESET} Use {Colors.BRIGHT_YELLOW}@<letter>{Colors.RESET} to expand a project (e.g., {Colors.BRIGHT_YELLOW}@a{Colors.RESET})")
+            # A status is part of the frame, so it needs a redraw to appear, and
+            # another one after the next command to clear it again
+            if status or status_shown:
+                dirty = True
             
-            # Show page indicator if multiple pages
-            if total_pages > 1:
-                print(f"\n{Colors.DIM}Page {current_page + 1}/{total_pages}{Colors.RESET}")
-            
-            print()  # Blank line before command bar
-            
-            commands = [
-                ("@x", "toggle"),
-                ("cs <s_id> <sc_id>", "copy sent"),
-                ("ch <mc_id> <before_mc_id>", "copy head"),
-                ("cp <mc_id> <proj_id>", "copy to proj"),
-                ("dh <mc_id>", "delete head"),
-                ("h/l", "page"),
-                ("?", "help"),
-                ("q", "quit")
-            ]
-            UI.print_command_bar(commands)
+            if dirty:
+                Screen.begin_frame()
+                Screen.clear()
+                UI.print_header("SENTENCE MAINTENANCE")
+                
+                # Assemble the current page and write it to the terminal in one call
+                page_lines = [""]
+                page_lines.extend(pages[current_page])
+                
+                # Show helpful prompt if all projects are collapsed
+                all_collapsed = collapsed_projects >= project_ids
+                
+                if all_collapsed and projects:
+                    page_lines.append("")
+                    page_lines.append(_TIP_LINE)
+                
+                # Show page indicator if multiple pages
+                if total_pages > 1:
+                    page_lines.append("")
+                    page_lines.append(_PAGE_TPL.format(page=current_page + 1, total=total_pages))
+                
+                # Result of the last command; starts with its own blank line
+                status_shown = bool(status)
+                if status:
+                    page_lines.append(status)
+                    status = None
+                
+                page_lines.append("")  # Blank line before command bar
+                
+                Screen.write_frame("\n".join(page_lines) + "\n" + command_bar)
+                Screen.end_frame()
+                dirty = False
             
             # Read command with F1 detection
             cmd, is_f1 = Input.read_command_with_f1()
@@ -177,27 +282,27 @@ def main():
                 # Previous page
                 if current_page > 0:
                     current_page -= 1
+                    dirty = True
                 continue
             
             elif cmd == 'l':
                 # Next page
                 if current_page < total_pages - 1:
                     current_page += 1
+                    dirty = True
                 continue
             
             elif command == '@':
                 # Toggle project collapse
-                match = re.match(r'^@([a-zA-Z0-9#]+)$', cmd, re.IGNORECASE)
-                if not match:
-                    UI.error("Invalid format. Use '@a' to toggle project")
-                    time.sleep(1)
+                letter = cmd[1:]
+                if not letter or not _TOGGLE_CHARS.issuperset(letter):
+                    status = UI.format_error("Invalid format. Use '@a' to toggle project")
                     continue
                 
-                letter = match.group(1).lower()
+                letter = letter.lower()
                 
                 if letter not in project_map:
-                    UI.error(f"Project [{letter}] not found")
-                    time.sleep(1)
+                    status = UI.format_error(f"Project [{letter}] not found")
                     continue
                 
                 proj_id = project_map[letter]
@@ -212,100 +317,110 @@ def main():
             
             elif cmd.startswith('cs '):
                 # Copy sentence
-                match = re.match(r'^cs\s+(\d+)\s+(\d+)$', cmd, re.IGNORECASE)
-                if not match:
-                    UI.error("Invalid format. Use 'cs <sentence_id> <target_sc_id>'")
-                    time.sleep(2)
+                ids = _parse_ids(cmd, 2)
+                if not ids:
+                    status = UI.format_error("Invalid format. Use 'cs <sentence_id> <target_sc_id>'")
                     continue
                 
-                sentence_id = int(match.group(1))
-                target_sc_id = int(match.group(2))
+                sentence_id, target_sc_id = ids
                 
                 if db.copy_sentence(sentence_id, target_sc_id):
-                    UI.success(f"Sentence {sentence_id} copied to sc_id:{target_sc_id}")
+                    status = UI.format_success(f"Sentence {sentence_id} copied to sc_id:{target_sc_id}")
+                    invalidate_project_lines(project_lines_cache, db.get_subcategory_project_id(target_sc_id))
+                    db_version += 1
                 else:
-                    UI.error("Failed to copy sentence")
+                    status = UI.format_error("Failed to copy sentence")
                 
-                time.sleep(2)
                 # Rebuild display
                 break
             
             elif cmd.startswith('ch '):
                 # Copy heading within same project (insert before another heading)
-                match = re.match(r'^ch\s+(\d+)\s+(\d+)$', cmd, re.IGNORECASE)
-                if not match:
-                    UI.error("Invalid format. Use 'ch <mc_id> <before_mc_id>'")
-                    time.sleep(2)
+                ids = _parse_ids(cmd, 2)
+                if not ids:
+                    status = UI.format_error("Invalid format. Use 'ch <mc_id> <before_mc_id>'")
                     continue
                 
-                mc_id = int(match.group(1))
-                before_mc_id = int(match.group(2))
+                mc_id, before_mc_id = ids
                 
                 if db.copy_major_category_before(mc_id, before_mc_id):
-                    UI.success(f"Heading mc_id:{mc_id} copied before mc_id:{before_mc_id}")
+                    status = UI.format_success(f"Heading mc_id:{mc_id} copied before mc_id:{before_mc_id}")
+                    invalidate_project_lines(project_lines_cache, db.get_major_category_project_id(mc_id))
+                    db_version += 1
                 else:
-                    UI.error("Failed to copy heading")
+                    status = UI.format_error("Failed to copy heading")
                 
-                time.sleep(2)
                 # Rebuild display
                 break
             
             elif cmd.startswith('cp '):
                 # Copy heading to another project
-                match = re.match(r'^cp\s+(\d+)\s+(\d+)$', cmd, re.IGNORECASE)
-                if not match:
-                    UI.error("Invalid format. Use 'cp <mc_id> <target_project_id>'")
-                    time.sleep(2)
+                ids = _parse_ids(cmd, 2)
+                if not ids:
+                    status = UI.format_error("Invalid format. Use 'cp <mc_id> <target_project_id>'")
                     continue
                 
-                mc_id = int(match.group(1))
-                target_proj_id = int(match.group(2))
+                mc_id, target_proj_id = ids
                 
                 # Copy to end of target project
                 if db.copy_major_category(mc_id, target_proj_id, 999):
-                    UI.success(f"Heading mc_id:{mc_id} copied to project {target_proj_id}")
+                    status = UI.format_success(f"Heading mc_id:{mc_id} copied to project {target_proj_id}")
+                    invalidate_project_lines(project_lines_cache, target_proj_id)
+                    db_version += 1
                 else:
-                    UI.error("Failed to copy heading")
+                    status = UI.format_error("Failed to copy heading")
                 
-                time.sleep(2)
-                # Rebuild display
+                # Rebuild display and reload the project list
+                projects = None
                 break
             
             elif cmd.startswith('dh '):
                 # Delete heading
-                match = re.match(r'^dh\s+(\d+)$', cmd, re.IGNORECASE)
-                if not match:
-                    UI.error("Invalid format. Use 'dh <mc_id>'")
-                    time.sleep(2)
+                ids = _parse_ids(cmd, 1)
+                if not ids:
+                    status = UI.format_error("Invalid format. Use 'dh <mc_id>'")
                     continue
                 
-                mc_id = int(match.group(1))
+                mc_id, = ids
+                
+                # Look the project up first, the heading is gone afterwards
+                proj_id = db.get_major_category_project_id(mc_id)
                 
                 if db.delete_major_category(mc_id):
-                    UI.success(f"Heading mc_id:{mc_id} deleted")
+                    status = UI.format_success(f"Heading mc_id:{mc_id} deleted")
+                    invalidate_project_lines(project_lines_cache, proj_id)
+                    db_version += 1
                 else:
-                    UI.error("Failed to delete heading")
+                    status = UI.format_error("Failed to delete heading")
                 
-                time.sleep(2)
                 # Rebuild display
                 break
             
             elif command == 'p':
-                # Refresh - rebuild display
+                # Refresh - reload projects and rebuild display
+                projects = None
+                project_lines_cache.clear()
+                db_version += 1
                 break
             
             else:
-                UI.error(f"Unknown command: {command}")
-                time.sleep(1)
+                status = UI.format_error(f"Unknown command: {command}")
 
 
 if __name__ == "__main__":
+    # Redraws happen on the alternate screen; leave it before reporting how we exited
     try:
+        Screen.buffer_output()
+        Screen.enter_alternate_screen()
         main()
     except KeyboardInterrupt:
+        Screen.leave_alternate_screen()
         print(f"\n\n{Colors.YELLOW}Interrupted by user{Colors.RESET}")
     except Exception as e:
+        Screen.leave_alternate_screen()
         UI.error(str(e))
         import traceback
         traceback.print_exc()
         input("Press Enter to continue...")
+    finally:
+        Screen.leave_alternate_screen()
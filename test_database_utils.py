@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for Database transaction handling (run with pytest)
+"""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from database_utils import Database
+
+
+SCHEMA_PATH = Path(__file__).parent / "database_schema.sql"
+
+
+def make_db(tmp_path):
+    """
+    Open a fresh database with one project, heading, subheading and sentence
+    The tables come from database_schema.sql, which has the UNIQUE name constraints
+    """
+    db_path = str(tmp_path / "test.db")
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA_PATH.read_text())
+    conn.close()
+    
+    db = Database(db_path)
+    project_id = db.create_project("P")
+    mc_id = db.create_major_category(project_id, "Heading")
+    sc_id = db.create_subcategory(mc_id, "Sub")
+    sentence_id = db.add_sentence(sc_id, "First sentence")
+    return db, project_id, mc_id, sc_id, sentence_id
+
+
+def test_failed_insert_leaves_no_open_transaction(tmp_path):
+    """A rejected duplicate must not leave a transaction open behind it"""
+    db, project_id, mc_id, sc_id, sentence_id = make_db(tmp_path)
+    
+    assert db.create_project("P") is None
+    assert not db.conn.in_transaction
+    
+    assert db.create_major_category(project_id, "Heading") is None
+    assert not db.conn.in_transaction
+    
+    db.close()
+
+
+def test_transactional_change_after_failed_insert(tmp_path):
+    """Duplicate heading followed by a delete, insert and move used to crash"""
+    db, project_id, mc_id, sc_id, sentence_id = make_db(tmp_path)
+    
+    assert db.create_major_category(project_id, "Heading") is None
+    db.delete_sentence(sentence_id)
+    assert db.get_sentences(sc_id) == []
+    
+    new_id = db.add_sentence(sc_id, "Second sentence")
+    assert db.create_subcategory(mc_id, "Sub") is None
+    assert db.insert_sentence(1, "Inserted", project_id)
+    
+    other_sc_id = db.create_subcategory(mc_id, "Other")
+    assert db.update_subcategory_name(other_sc_id, "Sub") is False
+    db.move_sentence(new_id, other_sc_id)
+    assert [row[0] for row in db.get_sentences(other_sc_id)] == [new_id]
+    
+    db.close()
+
+
+def test_transaction_refuses_to_discard_pending_write(tmp_path):
+    """An unended write must surface as an error, not be rolled back or committed"""
+    db, project_id, mc_id, sc_id, sentence_id = make_db(tmp_path)
+    
+    db.cursor.execute("UPDATE sentences SET content = 'Changed' WHERE id = ?", (sentence_id,))
+    assert db.conn.in_transaction
+    
+    with pytest.raises(sqlite3.OperationalError):
+        db.delete_sentence(sentence_id)
+    
+    # The pending change is still there for its owner to end
+    assert db.conn.in_transaction
+    db.conn.commit()
+    assert [row[:2] for row in db.get_sentences(sc_id)] == [(sentence_id, "Changed")]
+    
+    db.close()
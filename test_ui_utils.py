@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Tests for the command bar layout in ui_utils (run with pytest)
+"""
+
+from ui_utils import UI, _ANSI_RE
+
+
+# Eight commands shown as 'ab:cde', six columns each: 8 * 6 + 7 * 2 = 62 columns
+COMMANDS = tuple((f"a{i}", f"cd{i}") for i in range(8))
+
+
+def command_lines(cols):
+    """Visible text of the command lines (between the two separators)"""
+    lines = UI.format_command_bar(COMMANDS, cols).split("\n")[2:-2]
+    return [_ANSI_RE.sub('', line) for line in lines]
+
+
+def test_command_bar_exact_fit():
+    """A bar exactly as wide as the terminal stays on one line"""
+    lines = command_lines(62)
+    assert len(lines) == 1
+    assert len(lines[0]) == 62
+    
+    assert len(command_lines(63)) == 1
+
+
+def test_command_bar_wraps_between_commands():
+    """One column short, the last command moves to a second line"""
+    lines = command_lines(61)
+    assert len(lines) == 2
+    assert lines[1] == "a7:cd7"
+    assert all(len(line) <= 61 for line in lines)
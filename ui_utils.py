@@ -4,9 +4,125 @@ UI Utilities - Centralized color, screen, and UI management
 """
 
 import os
+import re
 import sys
-import tty
-import termios
+import select
+import shutil
+import signal
+from contextlib import contextmanager
+from functools import lru_cache
+
+if os.name == 'nt':
+    import ctypes
+    from ctypes import wintypes
+else:
+    import tty
+    import termios
+
+
+# Commands that open the help screen instead of being run
+_HELP_TOKENS = frozenset(('?', 'help'))
+
+# Any CSI escape sequence (colors, cursor movement), which takes no room on screen
+_ANSI_RE = re.compile(r'\x1b\[[0-9;?]*[@-~]')
+
+# Cursor position report sent by the terminal in reply to ESC [ 6 n
+_CURSOR_REPORT_RE = re.compile(rb'\x1b\[(\d+);(\d+)R')
+
+# Terminal size cached by Screen.get_size, dropped whenever the window is resized
+_cached_size = None
+
+
+def _invalidate_size(signum, frame):
+    """SIGWINCH handler - forget the cached terminal size"""
+    global _cached_size
+    _cached_size = None
+
+
+# Without SIGWINCH (Windows) a resize can't be noticed, so the size is never cached
+_SIZE_CACHEABLE = hasattr(signal, 'SIGWINCH')
+
+if _SIZE_CACHEABLE:
+    signal.signal(signal.SIGWINCH, _invalidate_size)
+
+
+def _visible_len(text):
+    """Length of text as shown on screen, not counting escape sequences"""
+    if '\x1b' not in text:
+        return len(text)
+    return len(_ANSI_RE.sub('', text))
+
+
+def _wrap(text, sgr):
+    """Color text with an SGR sequence followed by a reset; no-op when sgr is empty"""
+    if not sgr:
+        return text
+    return f"{sgr}{text}{Colors.RESET}"
+
+
+# Whether Screen.enter_alternate_screen switched screens and hasn't switched back yet
+_alternate_screen_active = False
+
+
+# (fd, cooked, raw) terminal modes of stdin, read once by _terminal_modes()
+_terminal_modes_cache = None
+
+# Local mode flags cleared for raw reads: no line buffering and no echo
+if os.name != 'nt':
+    _RAW_LFLAG_MASK = ~(termios.ICANON | termios.ECHO)
+
+
+def _terminal_modes():
+    """
+    Get stdin's file descriptor with its normal and raw terminal modes
+    The modes are read on first use and again only if stdin is replaced; the raw
+    mode only turns off line buffering and echo, which is all single-key reads need
+    Returns: (fd, cooked, raw)
+    """
+    global _terminal_modes_cache
+    fd = sys.stdin.fileno()
+    if _terminal_modes_cache is None or _terminal_modes_cache[0] != fd:
+        cooked = termios.tcgetattr(fd)
+        raw = cooked[:tty.CC] + [list(cooked[tty.CC])]
+        raw[tty.LFLAG] &= _RAW_LFLAG_MASK
+        raw[tty.CC][termios.VMIN] = 1
+        raw[tty.CC][termios.VTIME] = 0
+        _terminal_modes_cache = (fd, cooked, raw)
+    return _terminal_modes_cache
+
+
+if os.name == 'nt':
+    class _ConsoleScreenBufferInfo(ctypes.Structure):
+        """CONSOLE_SCREEN_BUFFER_INFO from the Win32 console API"""
+        _fields_ = [
+            ("dwSize", wintypes._COORD),
+            ("dwCursorPosition", wintypes._COORD),
+            ("wAttributes", wintypes.WORD),
+            ("srWindow", wintypes.SMALL_RECT),
+            ("dwMaximumWindowSize", wintypes._COORD),
+        ]
+
+
+def _clear_windows_console():
+    """
+    Clear the Windows console through the console API instead of spawning cls
+    Returns: False if stdout is not a console, so the caller can fall back
+    """
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    info = _ConsoleScreenBufferInfo()
+    if not kernel32.GetConsoleScreenBufferInfo(handle, ctypes.byref(info)):
+        return False
+    
+    cells = info.dwSize.X * info.dwSize.Y
+    origin = wintypes._COORD(0, 0)
+    written = wintypes.DWORD()
+    
+    sys.stdout.flush()
+    kernel32.FillConsoleOutputCharacterW(handle, ctypes.c_wchar(' '), cells, origin, ctypes.byref(written))
+    kernel32.FillConsoleOutputAttribute(handle, info.wAttributes, cells, origin, ctypes.byref(written))
+    kernel32.SetConsoleCursorPosition(handle, origin)
+    return True
 
 
 class Colors:
@@ -40,6 +156,30 @@ class Colors:
     BG_BLUE = '\033[44m'
     BG_CYAN = '\033[46m'
     BLUE_BG = '\033[44m'  # Alias for compatibility
+    
+    # Combined attributes, sent as one escape sequence instead of several
+    HEADER = '\033[44;97;1m'  # BG_BLUE + BRIGHT_WHITE + BOLD
+    HELP_TITLE = '\033[44;97m'  # BLUE_BG + BRIGHT_WHITE
+    BOLD_WHITE = '\033[1;97m'  # BOLD + BRIGHT_WHITE
+
+
+def _color_enabled():
+    """
+    Decide whether to emit colors: NO_COLOR turns them off and FORCE_COLOR on,
+    otherwise they are only used when stdout is a terminal
+    """
+    if os.environ.get('NO_COLOR'):
+        return False
+    if os.environ.get('FORCE_COLOR'):
+        return True
+    return sys.stdout is not None and sys.stdout.isatty()
+
+
+# Blank the color codes when they'd only end up as noise in a file or pipe; this runs
+# before anything below (or in other modules) builds strings from them
+if not _color_enabled():
+    for _name in [name for name in vars(Colors) if name.isupper()]:
+        setattr(Colors, _name, '')
 
 
 class Screen:
@@ -48,75 +188,187 @@ class Screen:
     @staticmethod
     def clear():
         """Clear the terminal screen"""
-        os.system('clear' if os.name != 'nt' else 'cls')
+        if os.name == 'nt':
+            if not _clear_windows_console():
+                os.system('cls')
+        else:
+            # Home the cursor and erase the display and scrollback like `clear`;
+            # this goes out together with whatever is drawn next
+            sys.stdout.write('\033[H\033[2J\033[3J')
     
     @staticmethod
-    def get_size():
-        """Get terminal size (rows, columns)"""
+    def buffer_output():
+        """
+        Stop sys.stdout from flushing at every newline, so a frame built from
+        several writes and prints reaches the terminal in one piece at the next
+        Screen.flush(), write_frame() or input() prompt
+        """
+        if hasattr(sys.stdout, 'reconfigure'):
+            sys.stdout.reconfigure(line_buffering=False)
+    
+    @staticmethod
+    def flush():
+        """Send buffered screen output to the terminal"""
+        sys.stdout.flush()
+    
+    @staticmethod
+    def enter_alternate_screen():
+        """Switch to the terminal's alternate screen so redraws don't fill the scrollback"""
+        global _alternate_screen_active
+        if os.name != 'nt' and not _alternate_screen_active:
+            sys.stdout.write('\033[?1049h')
+            sys.stdout.flush()
+            _alternate_screen_active = True
+    
+    @staticmethod
+    def leave_alternate_screen():
+        """
+        Return to the normal screen, restoring what was shown before
+        Does nothing if the alternate screen isn't active, so it is safe to call twice
+        (a second switch would restore the saved cursor again over later output)
+        """
+        global _alternate_screen_active
+        if _alternate_screen_active:
+            sys.stdout.write('\033[?1049l')
+            sys.stdout.flush()
+            _alternate_screen_active = False
+    
+    @staticmethod
+    def begin_frame():
+        """
+        Start a synchronized update: terminals that support it hold the display
+        until end_frame(), so a redraw never shows half drawn (others ignore it)
+        """
+        sys.stdout.write('\033[?2026h')
+    
+    @staticmethod
+    def end_frame():
+        """End a synchronized update started by begin_frame() and send it"""
+        sys.stdout.write('\033[?2026l')
+        sys.stdout.flush()
+    
+    @staticmethod
+    def write_frame(text):
+        """
+        Write a whole frame to the terminal with as few syscalls as possible
+        Pending sys.stdout output is flushed first so ordering is kept, then the
+        encoded frame goes straight to the file descriptor
+        """
+        sys.stdout.flush()
         try:
-            size = os.get_terminal_size()
-            return size.lines, size.columns
-        except:
-            return 24, 80
+            fd = sys.stdout.fileno()
+        except (AttributeError, ValueError, OSError):
+            # Not backed by a real file (e.g. redirected to a StringIO)
+            sys.stdout.write(text)
+            return
+        
+        data = memoryview(text.encode(sys.stdout.encoding or 'utf-8', 'replace'))
+        while data:
+            data = data[os.write(fd, data):]
+    
+    @staticmethod
+    def get_size():
+        """
+        Get terminal size (rows, columns), cached until the terminal is resized
+        Falls back to 24x80 when stdout is not a terminal
+        """
+        global _cached_size
+        if _cached_size is not None:
+            return _cached_size
+        
+        # shutil returns the fallback itself instead of raising when there's no terminal
+        size = shutil.get_terminal_size(fallback=(80, 24))
+        rows_cols = (size.lines, size.columns)
+        
+        if _SIZE_CACHEABLE:
+            _cached_size = rows_cols
+        return rows_cols
     
     @staticmethod
     def get_cursor_position():
         """Get current cursor position (row, col)"""
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(fd)
+        with Input.raw_mode() as fd:
             sys.stdout.write('\033[6n')
             sys.stdout.flush()
             
-            # Read response: ESC [ row ; col R
-            response = ''
-            while True:
-                ch = sys.stdin.read(1)
-                response += ch
-                if ch == 'R':
+            # Read response: ESC [ row ; col R - it normally arrives in one read;
+            # stop as soon as a whole report is in, whatever keys came with it
+            response = os.read(fd, 32)
+            match = _CURSOR_REPORT_RE.search(response)
+            while not match:
+                chunk = os.read(fd, 32)
+                if not chunk:
                     break
-            
-            # Parse response
-            if response.startswith('\033[') and response.endswith('R'):
-                coords = response[2:-1].split(';')
-                return int(coords[0]), int(coords[1])
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+                response += chunk
+                match = _CURSOR_REPORT_RE.search(response)
+        
+        if match:
+            return int(match.group(1)), int(match.group(2))
         return 1, 1
     
     @staticmethod
     def move_cursor(row, col):
-        """Move cursor to specific position"""
+        """Move cursor to specific position (buffered until Screen.flush)"""
         sys.stdout.write(f'\033[{row};{col}H')
-        sys.stdout.flush()
     
     @staticmethod
     def clear_line():
-        """Clear the current line"""
-        print('\r\033[K', end='', flush=True)
+        """Clear the current line (buffered until Screen.flush)"""
+        sys.stdout.write('\r\033[K')
+    
+    @staticmethod
+    def clear_lines(count):
+        """
+        Clear count lines from the cursor's line down and return to the start of
+        the first one, in a single write (buffered until Screen.flush)
+        """
+        up = f'\033[{count - 1}A' if count > 1 else ''
+        sys.stdout.write('\r' + '\033[K\n' * (count - 1) + '\033[K' + up + '\r')
     
     @staticmethod
     def clear_from_cursor():
-        """Clear from cursor to end of screen"""
+        """Clear from cursor to end of screen (buffered until Screen.flush)"""
         sys.stdout.write('\033[J')
-        sys.stdout.flush()
 
 
 class Input:
     """Input utilities"""
     
     @staticmethod
-    def getch():
-        """Get a single character from stdin"""
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
+    @contextmanager
+    def raw_mode():
+        """
+        Keep the terminal raw for a whole block of single-key reads, so the
+        terminal settings are switched once rather than around every key
+        Output processing stays on, so '\\n' still starts a new line, and keys
+        typed before the switch are kept for the first read (TCSANOW, not TCSAFLUSH)
+        Yields: stdin's file descriptor
+        """
+        fd, cooked, raw = _terminal_modes()
         try:
-            tty.setraw(fd)
-            ch = sys.stdin.read(1)
-            return ch
+            termios.tcsetattr(fd, termios.TCSANOW, raw)
+            yield fd
         finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+            termios.tcsetattr(fd, termios.TCSADRAIN, cooked)
+    
+    @staticmethod
+    def getch():
+        """Get a single character from stdin"""
+        with Input.raw_mode():
+            return sys.stdin.read(1)
+    
+    @staticmethod
+    def read_keys():
+        """
+        Wait for a keypress and return it together with any keys already queued
+        behind it (e.g. from a held key), read in as few os.read calls as possible
+        Multi-byte keys (arrows, function keys) come back whole, e.g. '\\x1b[D'
+        """
+        with Input.raw_mode() as fd:
+            keys = os.read(fd, 16)
+            while select.select([fd], [], [], 0)[0]:
+                keys += os.read(fd, 64)
+        return keys.decode('utf-8', errors='replace')
     
     @staticmethod
     def read_command_with_f1(prompt="> "):
@@ -128,12 +380,19 @@ class Input:
         cmd = input(f"{Colors.BRIGHT_GREEN}{prompt}{Colors.RESET}").strip()
         
         # Check if user wants help
-        if cmd.lower() in ['?', 'help']:
+        if cmd.lower() in _HELP_TOKENS:
             return '', True
         
         return cmd, False
 
 
+# Fixed starts of the message lines written by UI.success/error/info/warning
+_SUCCESS_PREFIX = f"\n{Colors.GREEN}✓{Colors.RESET} "
+_ERROR_PREFIX = f"\n{Colors.RED}Error:{Colors.RESET} "
+_INFO_PREFIX = f"\n{Colors.CYAN}ℹ{Colors.RESET} "
+_WARNING_PREFIX = f"\n{Colors.YELLOW}⚠{Colors.RESET} "
+
+
 class UI:
     """Common UI elements"""
     
@@ -141,23 +400,83 @@ class UI:
     def print_header(title, project_name=None):
         """Print a full-width blue header"""
         rows, cols = Screen.get_size()
-        
-        print(f"\n{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{Colors.BOLD}" + " "*cols + f"{Colors.RESET}")
-        
+        sys.stdout.write(UI._header_text(title, project_name, cols))
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _header_text(title, project_name, cols):
+        """
+        Build the whole header (leading newline and three rows) for one terminal width
+        Cached, since the same header is redrawn at the same width every frame
+        """
         if project_name:
             header_text = f"  {title}: {project_name}"
         else:
             header_text = f"  {title}"
         
-        padding = " " * (cols - len(header_text))
-        print(f"{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{Colors.BOLD}{header_text}{padding}{Colors.RESET}")
-        print(f"{Colors.BG_BLUE}{Colors.BRIGHT_WHITE}{Colors.BOLD}" + " "*cols + f"{Colors.RESET}")
+        style = Colors.HEADER
+        blank_row = f"{style}{' ' * cols}{Colors.RESET}"
+        title_row = f"{style}{header_text.ljust(cols)}{Colors.RESET}"
+        return f"\n{blank_row}\n{title_row}\n{blank_row}\n"
     
     @staticmethod
     def print_separator(char="─"):
         """Print a separator line"""
         rows, cols = Screen.get_size()
-        print(f"{Colors.DIM}{char * cols}{Colors.RESET}")
+        sys.stdout.write(UI._separator_line(char, cols) + "\n")
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _separator_line(char, cols):
+        """Build a dimmed full-width separator for one terminal width (cached)"""
+        return f"{Colors.DIM}{char * cols}{Colors.RESET}"
+    
+    @staticmethod
+    def format_command_bar(commands, cols=None):
+        """
+        Build the command bar text written by print_command_bar
+        commands: sequence of tuples (key, suffix, description)
+        cols: width of the separator lines (defaults to the terminal width)
+        """
+        if cols is None:
+            rows, cols = Screen.get_size()
+        
+        return UI._command_bar_text(tuple(commands), cols)
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _command_bar_text(commands, cols):
+        """Build the command bar for a tuple of commands and a width (cached)"""
+        # Break between commands rather than letting the terminal wrap mid-command
+        cmd_lines = []
+        line_parts = []
+        line_len = -2  # Each part adds 2 for the spaces before it; the first part has none
+        for part, part_len in UI._command_parts(commands):
+            if line_parts and line_len + 2 + part_len > cols:
+                cmd_lines.append("  ".join(line_parts))
+                line_parts = []
+                line_len = -2
+            line_parts.append(part)
+            line_len += 2 + part_len
+        cmd_lines.append("  ".join(line_parts))
+        
+        cmd_text = "\n".join(f"{Colors.BRIGHT_BLUE}{cmd_line}{Colors.RESET}" for cmd_line in cmd_lines)
+        separator = UI._separator_line("─", cols)
+        
+        return f"\n{separator}\n{cmd_text}\n{separator}\n"
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _command_parts(commands):
+        """
+        Format each command of a tuple of commands as (text, visible length)
+        Cached apart from the width, so a resize only redoes the line breaking
+        """
+        # Items are (key, description) or (prefix, suffix, description); the
+        # description is always last and everything before it forms the key
+        cmd_parts = [f"{Colors.BRIGHT_YELLOW}{''.join(item[:-1])}{Colors.RESET}:{item[-1]}"
+                     for item in commands]
+        return tuple((part, _visible_len(part)) for part in cmd_parts)
     
     @staticmethod
     def print_command_bar(commands):
@@ -166,24 +485,7 @@ class UI:
         commands: list of tuples (key, suffix, description)
         Example: [("h", "a <name>", "heading"), ("q", "", "quit")]
         """
-        rows, cols = Screen.get_size()
-        
-        cmd_parts = []
-        for item in commands:
-            if len(item) == 2:
-                # Simple format: (key, description)
-                key, desc = item
-                cmd_parts.append(f"{Colors.BRIGHT_YELLOW}{key}{Colors.RESET}:{desc}")
-            else:
-                # Full format: (prefix, suffix, description)
-                prefix, suffix, desc = item
-                cmd_parts.append(f"{Colors.BRIGHT_YELLOW}{prefix}{suffix}{Colors.RESET}:{desc}")
-        
-        cmd_line = "  ".join(cmd_parts)
-        
-        print(f"\n{Colors.DIM}{'─' * cols}{Colors.RESET}")
-        print(f"{Colors.BRIGHT_BLUE}{cmd_line}{Colors.RESET}")
-        print(f"{Colors.DIM}{'─' * cols}{Colors.RESET}")
+        sys.stdout.write(UI.format_command_bar(commands))
     
     @staticmethod
     def print_context(heading_name=None, heading_key=None, subheading_name=None, subheading_key=None):
@@ -191,34 +493,72 @@ class UI:
         context_parts = []
         
         if heading_name and heading_key:
-            context_parts.append(f"Heading: {Colors.BRIGHT_BLUE}[{heading_key}]{Colors.RESET} {Colors.BRIGHT_WHITE}{heading_name}{Colors.RESET}")
+            context_parts.append(f"Heading: {_wrap(f'[{heading_key}]', Colors.BRIGHT_BLUE)} {_wrap(heading_name, Colors.BRIGHT_WHITE)}")
         
         if subheading_name and subheading_key:
-            context_parts.append(f"Subheading: {Colors.CYAN}[{subheading_key}]{Colors.RESET} {Colors.BRIGHT_CYAN}{subheading_name}{Colors.RESET}")
+            context_parts.append(f"Subheading: {_wrap(f'[{subheading_key}]', Colors.CYAN)} {_wrap(subheading_name, Colors.BRIGHT_CYAN)}")
         
         if context_parts:
             context = " | ".join(context_parts)
         else:
-            context = f"{Colors.DIM}No heading selected{Colors.RESET}"
+            context = _wrap("No heading selected", Colors.DIM)
         
-        print(f"{context}")
+        sys.stdout.write(context + "\n")
     
     @staticmethod
     def success(message):
         """Print a success message"""
-        print(f"\n{Colors.GREEN}✓{Colors.RESET} {message}")
+        sys.stdout.write(UI.format_success(message) + "\n")
+    
+    @staticmethod
+    def format_success(message):
+        """Build a success message as printed by success() (starts with a blank line)"""
+        return f"{_SUCCESS_PREFIX}{message}"
     
     @staticmethod
     def error(message):
         """Print an error message"""
-        print(f"\n{Colors.RED}Error:{Colors.RESET} {message}")
+        sys.stdout.write(UI.format_error(message) + "\n")
+    
+    @staticmethod
+    def format_error(message):
+        """Build an error message as printed by error() (starts with a blank line)"""
+        return f"{_ERROR_PREFIX}{message}"
     
     @staticmethod
     def info(message):
         """Print an info message"""
-        print(f"\n{Colors.CYAN}ℹ{Colors.RESET} {message}")
+        sys.stdout.write(UI.format_info(message) + "\n")
+    
+    @staticmethod
+    def format_info(message):
+        """Build an info message as printed by info() (starts with a blank line)"""
+        return f"{_INFO_PREFIX}{message}"
     
     @staticmethod
     def warning(message):
         """Print a warning message"""
-        print(f"\n{Colors.YELLOW}⚠{Colors.RESET} {message}")
+        sys.stdout.write(UI.format_warning(message) + "\n")
+    
+    @staticmethod
+    def format_warning(message):
+        """Build a warning message as printed by warning() (starts with a blank line)"""
+        return f"{_WARNING_PREFIX}{message}"
+
+
+class Pager:
+    """Sequence of screen-sized pages that slices the line list on demand"""
+    
+    def __init__(self, lines, max_lines):
+        self.lines = lines
+        self.max_lines = max_lines
+    
+    def __len__(self):
+        # Always at least one (possibly empty) page
+        return max(1, (len(self.lines) + self.max_lines - 1) // self.max_lines)
+    
+    def __getitem__(self, page):
+        if not 0 <= page < len(self):
+            raise IndexError("page out of range")
+        start = page * self.max_lines
+        return self.lines[start:start + self.max_lines]